@@ -0,0 +1,265 @@
+# bench_parsers.py
+"""
+Compares HTML parser backends on recorded news pages.
+
+    python bench_parsers.py --record     # scrape every category once, saving pages
+    python bench_parsers.py [--repeat N] [--dir recorded_pages]
+    python bench_parsers.py --strain     # full vs selector-restricted builds
+    python bench_parsers.py --single-pass  # one walk per selector vs one walk per page
+
+--strain and --single-pass run each page through the extractor it was saved
+for: "<module>.<extractor>-<hash>.html" as recorded, "<module>.<extractor>.html"
+as in tests/fixtures/pages, or any page an expected.json manifest in (or
+next to) the directory lists, e.g.
+
+    python bench_parsers.py --strain --dir tests/fixtures/pages
+"""
+import argparse
+import glob
+import importlib
+import json
+import os
+import re
+import time
+import tracemalloc
+
+import soupsieve
+
+import html_parser
+
+RECORD_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "recorded_pages")
+BACKENDS = ["html.parser", "lxml", "html5lib"]
+# A selector every news page has, for the select-only comparison.
+CSS_SELECTOR = "a[href]"
+# "<module>.<extractor>.html", optionally with the "-<hash>" recording adds.
+_PAGE_RE = re.compile(r"^(?P<qualified>\w+\.\w+?)(?:-[0-9a-f]{12})?\.html$")
+MANIFEST = "expected.json"
+
+
+def record(directory):
+    import parse_cache
+
+    parse_cache.RECORD_DIR = directory
+    from business_and_finance import scrape_business_finance_news
+    from entertainment import scrape_entertainment_news
+    from environment import scrape_environment_news
+    from health import scrape_health_news
+    from higher_ed import scrape_higher_ed_news
+    from industry import scrape_industry_news
+    from news_sources import scrape_news
+    from sports import scrape_sports_news
+    from technology import scrape_technology_news
+
+    for region in ("India", "Global"):
+        scrape_news(region, deadline=None)
+        for scrape in (scrape_business_finance_news, scrape_entertainment_news, scrape_environment_news,
+                       scrape_health_news, scrape_higher_ed_news, scrape_industry_news,
+                       scrape_sports_news, scrape_technology_news):
+            scrape(region=region, deadline=None)
+    print(f"Recorded {len(glob.glob(os.path.join(directory, '*.html')))} pages in {directory}")
+
+
+def _time(func, pages, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for body in pages:
+            func(body)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def benchmark(directory, repeat):
+    paths = sorted(glob.glob(os.path.join(directory, "*.html")))
+    if not paths:
+        print(f"No recorded pages in {directory}; run with --record first.")
+        return
+    pages = []
+    for path in paths:
+        with open(path, "rb") as f:
+            pages.append(f.read())
+    total_kb = sum(len(body) for body in pages) / 1024
+    print(f"{len(pages)} pages, {total_kb:.0f} KB, best of {repeat}\n")
+
+    results = []
+    for backend in BACKENDS:
+        if not html_parser.available(backend):
+            print(f"{backend:<22} not installed")
+            continue
+        results.append((f"soup/{backend}", _time(lambda body: html_parser.make_soup(body, backend), pages, repeat)))
+        results.append((f"select/{backend}", _time(lambda body: html_parser.css(body, CSS_SELECTOR, backend),
+                                                   pages, repeat)))
+    if html_parser.available("selectolax"):
+        results.append(("select/selectolax", _time(lambda body: html_parser.css(body, CSS_SELECTOR, "selectolax"),
+                                                   pages, repeat)))
+    else:
+        print(f"{'selectolax':<22} not installed")
+
+    baseline = results[0][1] if results else None
+    for name, elapsed in results:
+        print(f"{name:<22} {elapsed * 1000:9.1f} ms  {elapsed * 1000 / len(pages):7.2f} ms/page  "
+              f"{baseline / elapsed:5.1f}x")
+
+
+def _peak_memory(func):
+    tracemalloc.start()
+    try:
+        result = func()
+        return result, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _manifest(directory):
+    """{page file name: [qualified extractor, ...]} from an expected.json in or next to `directory`."""
+    directory = os.path.abspath(directory)
+    for candidate in (os.path.join(directory, MANIFEST), os.path.join(os.path.dirname(directory), MANIFEST)):
+        if os.path.exists(candidate):
+            with open(candidate, encoding="utf-8") as f:
+                pages = {}
+                for qualified, entry in json.load(f).items():
+                    pages.setdefault(entry["page"], []).append(qualified)
+                return pages
+    return {}
+
+
+def _load_extractor(qualified):
+    module_name, _, func_name = qualified.rpartition(".")
+    try:
+        extract = getattr(importlib.import_module(module_name), func_name)
+    except (ImportError, AttributeError, ValueError):
+        return None
+    return getattr(extract, "spec", extract)
+
+
+def page_extractors(directory):
+    """
+    (qualified extractor name, extractor, path) for every page in
+    `directory`. Exits naming the pages that match no extractor rather
+    than quietly benchmarking fewer of them.
+    """
+    manifest = _manifest(directory)
+    found, unmatched = [], []
+    for path in sorted(glob.glob(os.path.join(directory, "*.html"))):
+        page = os.path.basename(path)
+        match = _PAGE_RE.match(page)
+        names = list(manifest.get(page, []))
+        if match and match.group("qualified") not in names:
+            names.insert(0, match.group("qualified"))
+        extractors = [(qualified, _load_extractor(qualified)) for qualified in names]
+        if not extractors or any(extract is None for _, extract in extractors):
+            unmatched.append(page)
+            continue
+        found.extend((qualified, extract, path) for qualified, extract in extractors)
+    if unmatched:
+        raise SystemExit(f"No extractor for {', '.join(unmatched)} in {directory}: name pages "
+                         f"<module>.<extractor>.html or list them in {MANIFEST}.")
+    return found
+
+
+def _read(path, pages={}):
+    if path not in pages:
+        with open(path, "rb") as f:
+            pages[path] = f.read()
+    return pages[path]
+
+
+def benchmark_strain(directory, repeat):
+    """Per page: parse time and peak memory of a full build vs the extractor's restricted one."""
+    extractors = page_extractors(directory)
+    if not extractors:
+        print(f"No recorded pages in {directory}; run with --record first.")
+        return
+    print(f"{'extractor':<52} {'KB':>6} {'full ms':>8} {'strain ms':>9} {'full KB':>8} {'strain KB':>9}")
+    totals = [0.0, 0.0, 0, 0]
+    mismatches = []
+    for qualified, extract, path in extractors:
+        strainer = html_parser.strainer_for(extract)
+        if strainer is None:
+            print(f"{qualified:<52} full tree needed")
+            continue
+        body = _read(path)
+
+        def full():
+            return extract(html_parser.make_soup(body))
+
+        def strained():
+            return extract(html_parser.make_soup(body, parse_only=strainer))
+
+        full_articles, full_peak = _peak_memory(full)
+        strained_articles, strained_peak = _peak_memory(strained)
+        full_time = _time(lambda _: full(), [body], repeat)
+        strained_time = _time(lambda _: strained(), [body], repeat)
+        mismatch = ""
+        if full_articles != strained_articles:
+            mismatch = "  MISMATCH"
+            mismatches.append(qualified)
+        print(f"{qualified:<52} {len(body) / 1024:6.0f} {full_time * 1000:8.1f} {strained_time * 1000:9.1f} "
+              f"{full_peak / 1024:8.0f} {strained_peak / 1024:9.0f}{mismatch}")
+        totals[0] += full_time
+        totals[1] += strained_time
+        totals[2] += full_peak
+        totals[3] += strained_peak
+    if totals[1]:
+        print(f"\ntime {totals[0] / totals[1]:.1f}x faster, peak memory {totals[2] / max(totals[3], 1):.1f}x lower")
+    if mismatches:
+        raise SystemExit(f"Restricted builds changed the articles of {', '.join(mismatches)}")
+
+
+def _per_selector_walk(spec, compiled, soup):
+    """What declared sources did before: one full-tree select per selector."""
+    return spec._extract(tag for selector in compiled for tag in selector.select(soup))
+
+
+def _as_set(articles):
+    return {(article["title"], article["url"], article["source"]) for article in articles}
+
+
+def benchmark_single_pass(directory, repeat):
+    """
+    Per page of a declared source: selector-by-selector walks vs one
+    combined walk. Document order legitimately differs between the two, so
+    their articles are compared as sets.
+    """
+    specs = [(qualified, spec, path) for qualified, spec, path in page_extractors(directory)
+             if hasattr(spec, "selectors")]
+    if not specs:
+        print(f"No recorded pages of declared sources in {directory}; run with --record first.")
+        return
+    print(f"{'source':<52} {'sels':>4} {'loop ms':>8} {'single ms':>9}")
+    totals = [0.0, 0.0]
+    mismatches = []
+    for qualified, spec, path in specs:
+        soup = html_parser.make_soup(_read(path))
+        compiled = [soupsieve.compile(selector) for selector in spec.selectors]
+        mismatch = ""
+        if _as_set(_per_selector_walk(spec, compiled, soup)) != _as_set(spec(soup)):
+            mismatch = "  MISMATCH"
+            mismatches.append(qualified)
+        loop_time = _time(lambda _: _per_selector_walk(spec, compiled, soup), [None], repeat)
+        single_time = _time(lambda _: spec(soup), [None], repeat)
+        print(f"{qualified:<52} {len(spec.selectors):4} {loop_time * 1000:8.2f} {single_time * 1000:9.2f}{mismatch}")
+        totals[0] += loop_time
+        totals[1] += single_time
+    print(f"\nsingle pass {totals[0] / totals[1]:.1f}x faster over {directory}")
+    if mismatches:
+        raise SystemExit(f"The combined walk changed the articles of {', '.join(mismatches)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--record", action="store_true", help="scrape live sources and save their pages")
+    parser.add_argument("--dir", default=RECORD_DIR)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--strain", action="store_true", help="compare full and restricted tree builds")
+    parser.add_argument("--single-pass", action="store_true", help="compare per-selector and combined walks")
+    args = parser.parse_args()
+    if args.record:
+        record(args.dir)
+    elif args.strain:
+        benchmark_strain(args.dir, args.repeat)
+    elif args.single_pass:
+        benchmark_single_pass(args.dir, args.repeat)
+    else:
+        benchmark(args.dir, args.repeat)
@@ -0,0 +1,78 @@
+# bench_prompt.py
+"""
+Compares the size of the old echo-everything ranking protocol with the
+numeric-ID one, for the prompt and for a reply scoring every article.
+
+    python bench_prompt.py [--articles articles.json] [--region India]
+
+Without --articles, today's general headlines for --region are scraped.
+Tokens are counted by Gemini when GOOGLE_API_KEY is set, otherwise
+estimated at four characters per token.
+"""
+import argparse
+import json
+
+import ranking_service
+from ranking_service import build_ranking_prompt
+
+
+def old_prompt(articles):
+    prompt = (
+        "You are an expert news assistant. "
+        "Given the following list of news headlines (with their sources and links), "
+        "for each headline, assign an importance score from 1 (least important) to 10 (most important) for inclusion in an education news digest. "
+        "Consider newsworthiness, impact, and diversity. "
+        "Return your answer as a numbered list in this format:\n"
+        "<SOURCE>, <HEADLINE>\n<LINK>\nScore: <score>\n\n"
+        "Here is the list:\n"
+    )
+    for idx, article in enumerate(articles, 1):
+        prompt += f"{idx}. {article.get('source', 'Unknown Source')}, {article['title']}\n{article['url']}\n"
+    return prompt
+
+
+def old_reply(articles):
+    return "".join(
+        f"{idx}. {article.get('source', 'Unknown Source')}, {article['title']}\n{article['url']}\nScore: 7\n\n"
+        for idx, article in enumerate(articles, 1)
+    )
+
+
+def new_reply(articles):
+    return "".join(f"{idx}:7\n" for idx in range(1, len(articles) + 1))
+
+
+def token_counter():
+    ranker = ranking_service.get()
+    if ranker.available():
+        try:
+            ranker.count_tokens("ping")
+            return "Gemini", ranker.count_tokens
+        except Exception as e:
+            print(f"Can't count with Gemini, estimating: {e}")
+    return "estimated", lambda text: (len(text) + 3) // 4
+
+
+def main(articles):
+    how, count = token_counter()
+    print(f"{len(articles)} articles, tokens {how}\n")
+    print(f"{'':<8} {'old':>8} {'new':>8} {'saved':>6}")
+    for name, old, new in (("prompt", old_prompt, build_ranking_prompt), ("reply", old_reply, new_reply)):
+        old_tokens, new_tokens = count(old(articles)), count(new(articles))
+        saved = 1 - new_tokens / old_tokens if old_tokens else 0
+        print(f"{name:<8} {old_tokens:8} {new_tokens:8} {saved:6.0%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", help="JSON list of {title, url, source} articles")
+    parser.add_argument("--region", default="India")
+    args = parser.parse_args()
+    if args.articles:
+        with open(args.articles, encoding="utf-8") as f:
+            articles = json.load(f)
+    else:
+        from news_sources import scrape_news
+
+        articles, _ = scrape_news(args.region)
+    main(articles)
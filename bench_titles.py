@@ -0,0 +1,128 @@
+# bench_titles.py
+"""
+Compares title_normalizer against the per-module cleaners it replaced.
+
+    python bench_titles.py [--repeat N] [--dir recorded_pages]
+
+Titles come from the recorded pages (see bench_parsers.py --record), or
+distinct variants of a built-in sample when there are none. The "uncached"
+column times the functions without their memo caches (`__wrapped__`); the
+"cached" one cleans each title REPEATS_PER_TITLE times, as a title is across
+pagination, the source cache and the email render, and reports the hit rate
+that buys.
+"""
+import argparse
+import glob
+import os
+import re
+import time
+import unicodedata
+
+import html_parser
+import title_normalizer
+from bench_parsers import RECORD_DIR
+
+SAMPLE_TITLES = [
+    "  India’s GDP grows 7.8%\nin Q1 — beating estimates  ",
+    "Subscribe to our newsletter",
+    "RBI keeps repo rate unchanged…\xa0markets rally",
+    "“We will win”: captain backs team ahead of final",
+    "Short",
+    "Monsoon update: IMD predicts heavy rain in Kerala, Karnataka",
+    "Scientists find 5′ 10″ tall ancient statue in Egypt",
+    "Tech layoffs continue as AI reshapes hiring – report",
+]
+# How many times a title is cleaned per round.
+REPEATS_PER_TITLE = 3
+
+
+def old_normalize(text):
+    return ' '.join(text.strip().split())
+
+
+def old_clean_title(title):
+    if not title:
+        return None
+    title = re.sub(r'\s+', ' ', title.strip())
+    if len(title) < 10 or len(title) > 200:
+        return None
+    skip_words = ['subscribe', 'login', 'register', 'advertisement', 'menu', 'search', 'newsletter']
+    if any(word in title.lower() for word in skip_words):
+        return None
+    return title
+
+
+def old_ascii_title(title):
+    if not title:
+        return None
+    replacements = {
+        '“': '"', '”': '"', '‘': "'", '’': "'", '—': '-', '–': '-',
+        '…': '...', '\xa0': ' ', '′': "'", '″': '"',
+    }
+    for unicode_char, ascii_char in replacements.items():
+        title = title.replace(unicode_char, ascii_char)
+    title = unicodedata.normalize('NFKD', title)
+    title = title.encode('ascii', 'ignore').decode('ascii')
+    return old_clean_title(title)
+
+
+def load_titles(directory):
+    titles = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.html"))):
+        with open(path, "rb") as f:
+            soup = html_parser.make_soup(f.read())
+        titles.extend(a.get_text() for a in soup.select("a[href]"))
+    if titles:
+        return titles
+    # Distinct titles, so the uncached timings don't flatter repeated strings.
+    return [f"{title} ({i})" if len(title) > 8 else title for i in range(500) for title in SAMPLE_TITLES]
+
+
+def _clear_caches():
+    for cached in (title_normalizer.normalize, title_normalizer.clean_title, title_normalizer.ascii_title):
+        cached.cache_clear()
+
+
+def _time(func, titles, repeat, passes=1):
+    best = None
+    for _ in range(repeat):
+        _clear_caches()
+        start = time.perf_counter()
+        for _ in range(passes):
+            for title in titles:
+                func(title)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def benchmark(directory, repeat):
+    titles = load_titles(directory)
+    print(f"{len(titles)} titles ({len(set(titles))} distinct), best of {repeat}; "
+          f"cached runs clean each title {REPEATS_PER_TITLE}x\n")
+    print(f"{'':<12} {'old ms':>8} {'uncached ms':>11} {'speedup':>7}   {'old x' + str(REPEATS_PER_TITLE):>8} "
+          f"{'cached ms':>9} {'hit rate':>8}  differing")
+    pairs = [
+        ("normalize", old_normalize, title_normalizer.normalize),
+        ("clean_title", old_clean_title, title_normalizer.clean_title),
+        ("ascii_title", old_ascii_title, title_normalizer.ascii_title),
+    ]
+    for name, old, cached in pairs:
+        uncached = cached.__wrapped__
+        mismatches = sum(old(title) != uncached(title) for title in titles)
+        old_time = _time(old, titles, repeat)
+        uncached_time = _time(uncached, titles, repeat)
+        old_repeated = _time(old, titles, repeat, REPEATS_PER_TITLE)
+        cached_time = _time(cached, titles, repeat, REPEATS_PER_TITLE)
+        info = cached.cache_info()
+        hit_rate = info.hits / max(info.hits + info.misses, 1)
+        print(f"{name:<12} {old_time * 1000:8.1f} {uncached_time * 1000:11.1f} {old_time / uncached_time:6.1f}x   "
+              f"{old_repeated * 1000:8.1f} {cached_time * 1000:9.1f} {hit_rate:8.0%}  {mismatches}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dir", default=RECORD_DIR)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    benchmark(args.dir, args.repeat)
@@ -0,0 +1,152 @@
+# circuit_breaker.py
+import os
+import threading
+import time
+
+import http_client
+
+# Consecutive failed or empty scrapes before a source is skipped.
+FAILURE_THRESHOLD = int(os.getenv("NEWS_BREAKER_FAILURES", "3"))
+# Seconds an open circuit skips its source; doubles on every failed probe.
+COOLDOWN = float(os.getenv("NEWS_BREAKER_COOLDOWN", "300"))
+MAX_COOLDOWN = float(os.getenv("NEWS_BREAKER_MAX_COOLDOWN", "3600"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpen(Exception):
+    pass
+
+
+class CircuitBreaker:
+    """
+    Tracks one source's consecutive failures. A scrape that raises or
+    yields no articles counts as a failure (unless the caller's deadline
+    had run out, which says nothing about the source); after `failure_threshold` of
+    them the circuit opens and the source is skipped for `cooldown`
+    seconds. Once that has passed a single half-open trial scrape is let
+    through: success closes the circuit, failure re-opens it with twice
+    the cool-down (up to `max_cooldown`).
+    """
+
+    def __init__(self, failure_threshold=FAILURE_THRESHOLD, cooldown=COOLDOWN, max_cooldown=MAX_COOLDOWN):
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.state = CLOSED
+        self.failures = 0
+        self.cooldown = cooldown
+        self.opened_at = None
+        self.last_error = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Returns True if a scrape may run now; claims the half-open trial."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.cooldown:
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self.cooldown = self.base_cooldown
+            self.last_error = None
+            self._trial_running = False
+
+    def record_failure(self, error):
+        with self._lock:
+            self.failures += 1
+            self.last_error = error
+            if self.state == HALF_OPEN:
+                self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+                self._open()
+            elif self.state == CLOSED and self.failures >= self.failure_threshold:
+                self._open()
+            self._trial_running = False
+
+    def record_inconclusive(self):
+        """The scrape said nothing about the source (e.g. our own deadline cut it off)."""
+        with self._lock:
+            self._trial_running = False
+
+    def _open(self):
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+
+    def retry_in(self):
+        with self._lock:
+            if self.state != OPEN:
+                return 0.0
+            return max(0.0, self.cooldown - (time.monotonic() - self.opened_at))
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "state": self.state,
+                "failures": self.failures,
+                "cooldown": self.cooldown,
+                "last_error": self.last_error,
+            }
+
+
+_lock = threading.Lock()
+_breakers = {}
+
+
+def get(key):
+    with _lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = _breakers[key] = CircuitBreaker()
+        return breaker
+
+
+def call(key, func):
+    """Runs `func()` for source `key` through its breaker; raises CircuitOpen if skipped."""
+    breaker = get(key)
+    if not breaker.allow():
+        raise CircuitOpen(f"circuit open ({breaker.failures} failures), retry in {breaker.retry_in():.0f}s")
+    try:
+        articles = func()
+    except Exception as e:
+        if _out_of_time():
+            breaker.record_inconclusive()
+        else:
+            breaker.record_failure(str(e))
+        raise
+    if articles:
+        breaker.record_success()
+    elif _out_of_time():
+        # Cut short by the caller's budget (or started too late to use it),
+        # not a sign the source is down.
+        breaker.record_inconclusive()
+    else:
+        breaker.record_failure("no articles")
+    return articles
+
+
+def _out_of_time():
+    left = http_client.remaining()
+    return left is not None and left <= 0
+
+
+def health():
+    """Per-source breaker state, keyed like the source cache."""
+    with _lock:
+        breakers = dict(_breakers)
+    return {key: breaker.snapshot() for key, breaker in breakers.items()}
+
+
+def reset():
+    with _lock:
+        _breakers.clear()
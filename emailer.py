@@ -5,47 +5,7 @@ from email.mime.multipart import MIMEMultipart
 from datetime import datetime
 
 
-import re
-import unicodedata
-
-def clean_title(title):
-    if not title:
-        return None
-    
-    # First, clean Unicode characters
-    # Replace common problematic Unicode characters
-    replacements = {
-        '"': '"',  # Left double quotation mark
-        '"': '"',  # Right double quotation mark
-        ''': "'",  # Left single quotation mark
-        ''': "'",  # Right single quotation mark
-        '—': '-',  # Em dash
-        '–': '-',  # En dash
-        '…': '...',  # Horizontal ellipsis
-        ' ': ' ',  # Non-breaking space
-        '′': "'",  # Prime
-        '″': '"',  # Double prime
-    }
-    
-    for unicode_char, ascii_char in replacements.items():
-        title = title.replace(unicode_char, ascii_char)
-    
-    # Normalize Unicode and convert to ASCII
-    title = unicodedata.normalize('NFKD', title)
-    title = title.encode('ascii', 'ignore').decode('ascii')
-    
-    # Clean whitespace
-    title = re.sub(r'\s+', ' ', title.strip())
-    
-    if len(title) < 10 or len(title) > 200:
-        return None
-    
-    # Filter out navigation items and ads
-    skip_words = ['subscribe', 'login', 'register', 'advertisement', 'menu', 'search', 'newsletter']
-    if any(word in title.lower() for word in skip_words):
-        return None
-    
-    return title
+from title_normalizer import ascii_title as clean_title
 
 def build_html_email(articles, topic="News"):
     html_body = f"""
@@ -1,220 +1,122 @@
-import requests
-from bs4 import BeautifulSoup
+from parse_cache import parse_articles
 from news_sources import get_session, clean_title
-import time
+from functools import partial
+from source_registry import register
+from source_runner import scrape_category_async, run_sync, DEFAULT_DEADLINE
 
-# --- Indian Entertainment Sources (Placeholders) ---
-
-def scrape_india_today_entertainment_india():
-    try:
-        session = get_session()
-        url = "https://www.indiatoday.in/entertainment"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-        seen_titles = set()
-
-        # The articles are in 'a' tags with a 'title' attribute, inside an 'h3'
-        for tag in soup.select('h3 a[title]'):
-            title = clean_title(tag.get('title'))
-            href = tag.get('href', '')
-
-            if title and href and title not in seen_titles:
-                if href.startswith('/'):
-                    href = "https://www.indiatoday.in" + href
-                
-                articles.append({"title": title, "url": href, "source": "India Today"})
-                seen_titles.add(title)
-                
-        return articles
-    except Exception as e:
-        print(f"Error scraping India Today Entertainment: {e}")
-        return []
-
-def scrape_financial_express_entertainment_india():
-    try:
-        session = get_session()
-        url = "https://www.financialexpress.com/life/entertainment/"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-        seen_titles = set()
-
-        # Each article is within a div with class 'entry-wrapper'
-        for item in soup.select('div.entry-wrapper'):
-            title_tag = item.find('h2', class_='entry-title')
-            summary_tag = item.find('div', class_='post-excerpt')
-            
-            if not title_tag or not title_tag.find('a'):
-                continue
-                
-            href = title_tag.find('a')['href']
-            
-            # Use summary as title if available, otherwise use the main title
-            if summary_tag and summary_tag.find('p'):
-                title = clean_title(summary_tag.p.get_text())
-            else:
-                title = clean_title(title_tag.a.get_text())
-
-            if title and href and title not in seen_titles:
-                # URLs are absolute
-                articles.append({"title": title, "url": href, "source": "Financial Express"})
-                seen_titles.add(title)
-
-        return articles
-    except Exception as e:
-        print(f"Error scraping Financial Express Entertainment: {e}")
-        return []
+# Sources that are a plain headline-link list are declared, not hand-written.
+_source = partial(register, __name__, clean=clean_title, session=get_session)
 
-def scrape_ndtv_entertainment_india():
-    try:
-        session = get_session()
-        url = "https://www.ndtv.com/topic/entertainment-news"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-        seen_titles = set()
-
-        # The articles are in 'a' tags inside an 'h3' with a specific class
-        for item in soup.select('h3.SrchLstPg_ttl-lnk'):
-            a_tag = item.find('a', class_='SrchLstPg_ttl')
-            if not a_tag:
-                continue
-                
-            title = clean_title(a_tag.get_text())
-            href = a_tag.get('href', '')
-
-            if title and href and title not in seen_titles:
-                # URLs are already absolute
-                articles.append({"title": title, "url": href, "source": "NDTV"})
-                seen_titles.add(title)
-
-        return articles
-    except Exception as e:
-        print(f"Error scraping NDTV Entertainment: {e}")
-        return []
-
-def scrape_deccan_herald_entertainment_india():
-    try:
-        session = get_session()
-        url = "https://www.deccanherald.com/entertainment"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-        seen_titles = set()
-
-        # The articles are in 'a' tags, with the title in an 'h2' tag
-        for a_tag in soup.select('a[href*="/entertainment/"]'):
-            h2_tag = a_tag.find('h2', class_='headline')
-            if not h2_tag:
-                continue
-
-            title = clean_title(h2_tag.get_text())
-            href = a_tag.get('href', '')
+# --- Indian Entertainment Sources (Placeholders) ---
 
-            if title and href and title not in seen_titles:
-                if href.startswith('/'):
-                    href = "https://www.deccanherald.com" + href
-                
-                articles.append({"title": title, "url": href, "source": "Deccan Herald"})
-                seen_titles.add(title)
+scrape_india_today_entertainment_india = _source(
+    "scrape_india_today_entertainment_india",
+    "India Today",
+    "https://www.indiatoday.in/entertainment",
+    selectors=['h3 a[title]'],
+    title_attr='title',
+    base_url="https://www.indiatoday.in",
+    unrooted="keep",
+    error_name="India Today Entertainment",
+)
+
+# Hand-written: the title is the excerpt when there is one, else the headline link.
+def _extract_financial_express_entertainment_india(soup):
+    articles = []
+    seen_titles = set()
 
-        return articles
-    except Exception as e:
-        print(f"Error scraping Deccan Herald Entertainment: {e}")
-        return []
+    # Each article is within a div with class 'entry-wrapper'
+    for item in soup.select('div.entry-wrapper'):
+        title_tag = item.find('h2', class_='entry-title')
+        summary_tag = item.find('div', class_='post-excerpt')
 
-def scrape_hindustan_times_entertainment_india():
-    try:
-        session = get_session()
-        url = "https://www.hindustantimes.com/entertainment"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-        seen_titles = set()
+        if not title_tag or not title_tag.find('a'):
+            continue
 
-        for link in soup.select('h3 a[href*="/entertainment/"], h2 a[href*="/entertainment/"]'):
-            title = clean_title(link.get_text())
-            href = link.get('href', '')
+        href = title_tag.find('a')['href']
 
-            if title and href and title not in seen_titles:
-                if href.startswith('/'):
-                    href = "https://www.hindustantimes.com" + href
-                articles.append({"title": title, "url": href, "source": "Hindustan Times"})
-                seen_titles.add(title)
-        return articles
-    except Exception as e:
-        print(f"Error scraping Hindustan Times Entertainment: {e}")
-        return []
+        # Use summary as title if available, otherwise use the main title
+        if summary_tag and summary_tag.find('p'):
+            title = clean_title(summary_tag.p.get_text())
+        else:
+            title = clean_title(title_tag.a.get_text())
 
-def scrape_times_of_india_entertainment_india():
-    try:
-        session = get_session()
-        url = "https://timesofindia.indiatimes.com/entertainment"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-        seen_titles = set()
+        if title and href and title not in seen_titles:
+            # URLs are absolute
+            articles.append({"title": title, "url": href, "source": "Financial Express"})
+            seen_titles.add(title)
 
-        for link in soup.select('a.border_color.VeCXM.SFmi8'):
-            p_tag = link.find('p', class_='CRKrj style_change')
-            if not p_tag:
-                continue
-            title = clean_title(p_tag.get_text())
-            href = link.get('href', '')
-            if title and href and title not in seen_titles:
-                if not href.startswith('http'):
-                    href = "https://timesofindia.indiatimes.com" + href
-                articles.append({"title": title, "url": href, "source": "Times of India"})
-                seen_titles.add(title)
-        return articles
-    except Exception as e:
-        print(f"Error scraping Times of India Entertainment: {e}")
-        return []
+    return articles
 
-def scrape_indian_express_entertainment_india():
+def scrape_financial_express_entertainment_india():
     try:
         session = get_session()
-        url = "https://indianexpress.com/section/entertainment/"
+        url = "https://www.financialexpress.com/life/entertainment/"
         response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-        seen_titles = set()
-
-        for link in soup.select('h2.myie-article-title a, h3.myie-article-title a'):
-            title = clean_title(link.get('title', ''))
-            href = link.get('href', '')
-
-            if title and href and title not in seen_titles:
-                articles.append({"title": title, "url": href, "source": "Indian Express"})
-                seen_titles.add(title)
-        return articles
+        return parse_articles(response, _extract_financial_express_entertainment_india, "Financial Express")
     except Exception as e:
-        print(f"Error scraping Indian Express Entertainment: {e}")
+        print(f"Error scraping Financial Express Entertainment: {e}")
         return []
 
-def scrape_the_hindu_entertainment_india():
-    articles = []
-    seen_titles = set()
-    session = get_session()
-    
-    try:
-        for page in range(1, 5):
-            url = f"https://www.thehindu.com/entertainment/?page={page}"
-            response = session.get(url, timeout=15)
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            for link in soup.select('h3.title > a, h2.title > a'):
-                title = clean_title(link.get_text())
-                href = link.get('href', '')
-
-                if title and href and title not in seen_titles:
-                    articles.append({"title": title, "url": href, "source": "The Hindu"})
-                    seen_titles.add(title)
-        return articles
-    except Exception as e:
-        print(f"Error scraping The Hindu Entertainment: {e}")
-        return []
+scrape_ndtv_entertainment_india = _source(
+    "scrape_ndtv_entertainment_india",
+    "NDTV",
+    "https://www.ndtv.com/topic/entertainment-news",
+    selectors=['h3.SrchLstPg_ttl-lnk a.SrchLstPg_ttl'],
+    unrooted="keep",
+    error_name="NDTV Entertainment",
+)
+
+scrape_deccan_herald_entertainment_india = _source(
+    "scrape_deccan_herald_entertainment_india",
+    "Deccan Herald",
+    "https://www.deccanherald.com/entertainment",
+    selectors=['a[href*="/entertainment/"]'],
+    title_selector='h2.headline',
+    base_url="https://www.deccanherald.com",
+    unrooted="keep",
+    error_name="Deccan Herald Entertainment",
+)
+
+scrape_hindustan_times_entertainment_india = _source(
+    "scrape_hindustan_times_entertainment_india",
+    "Hindustan Times",
+    "https://www.hindustantimes.com/entertainment",
+    selectors=['h3 a[href*="/entertainment/"]', 'h2 a[href*="/entertainment/"]'],
+    base_url="https://www.hindustantimes.com",
+    unrooted="keep",
+    error_name="Hindustan Times Entertainment",
+)
+
+scrape_times_of_india_entertainment_india = _source(
+    "scrape_times_of_india_entertainment_india",
+    "Times of India",
+    "https://timesofindia.indiatimes.com/entertainment",
+    selectors=['a.border_color.VeCXM.SFmi8'],
+    title_selector='p.CRKrj.style_change',
+    base_url="https://timesofindia.indiatimes.com",
+    unrooted="join",
+    error_name="Times of India Entertainment",
+)
+
+scrape_indian_express_entertainment_india = _source(
+    "scrape_indian_express_entertainment_india",
+    "Indian Express",
+    "https://indianexpress.com/section/entertainment/",
+    selectors=['h2.myie-article-title a', 'h3.myie-article-title a'],
+    title_attr='title',
+    unrooted="keep",
+    error_name="Indian Express Entertainment",
+)
+
+scrape_the_hindu_entertainment_india = _source(
+    "scrape_the_hindu_entertainment_india",
+    "The Hindu",
+    [f"https://www.thehindu.com/entertainment/?page={page}" for page in range(1, 5)],
+    selectors=['h3.title > a', 'h2.title > a'],
+    unrooted="keep",
+    error_name="The Hindu Entertainment",
+)
 
 # --- Global Entertainment Sources (Placeholders) ---
 
@@ -228,98 +130,52 @@ def scrape_guardian_film_global():
     # To-do: Add scraping logic here
     return []
 
-def scrape_washington_post_entertainment_global():
-    try:
-        session = get_session()
-        url = "https://www.washingtonpost.com/entertainment/"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-        seen_titles = set()
-
-        for a_tag in soup.select('a.wpds-c-ibuqEe[href*="/arts-entertainment/"]'):
-            p_tag = a_tag.find('p', class_='wpds-c-exSVqq')
-            if not p_tag:
-                continue
-            title = clean_title(p_tag.get_text())
-            href = a_tag.get('href', '')
-            if title and href and title not in seen_titles:
-                articles.append({"title": title, "url": href, "source": "Washington Post"})
-                seen_titles.add(title)
-        return articles
-    except Exception as e:
-        print(f"Error scraping Washington Post Entertainment: {e}")
-        return []
-
-def scrape_cnn_entertainment_global():
-    try:
-        session = get_session()
-        url = "https://edition.cnn.com/entertainment"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-        seen_titles = set()
-        # Both structures use a.container__link--type-article
-        for a_tag in soup.select('a.container__link--type-article'):
-            span = a_tag.find('span', class_='container__headline-text')
-            if not span:
-                continue
-            title = clean_title(span.get_text())
-            href = a_tag.get('href', '')
-            if title and href and title not in seen_titles:
-                if href.startswith('/'):
-                    href = 'https://edition.cnn.com' + href
-                articles.append({"title": title, "url": href, "source": "CNN Entertainment"})
-                seen_titles.add(title)
-        return articles
-    except Exception as e:
-        print(f"Error scraping CNN Entertainment: {e}")
-        return []
-
-def scrape_entertainment_news(region="India", sources=None):
+scrape_washington_post_entertainment_global = _source(
+    "scrape_washington_post_entertainment_global",
+    "Washington Post",
+    "https://www.washingtonpost.com/entertainment/",
+    selectors=['a.wpds-c-ibuqEe[href*="/arts-entertainment/"]'],
+    title_selector='p.wpds-c-exSVqq',
+    unrooted="keep",
+    error_name="Washington Post Entertainment",
+)
+
+scrape_cnn_entertainment_global = _source(
+    "scrape_cnn_entertainment_global",
+    "CNN Entertainment",
+    "https://edition.cnn.com/entertainment",
+    selectors=['a.container__link--type-article'],
+    title_selector='span.container__headline-text',
+    base_url="https://edition.cnn.com",
+    unrooted="keep",
+)
+
+india_source_map = {
+    "india_today_entertainment": scrape_india_today_entertainment_india,
+    "financial_express_entertainment": scrape_financial_express_entertainment_india,
+    "ndtv_entertainment": scrape_ndtv_entertainment_india,
+    "deccan_herald_entertainment": scrape_deccan_herald_entertainment_india,
+    "hindustan_times_entertainment": scrape_hindustan_times_entertainment_india,
+    "times_of_india_entertainment": scrape_times_of_india_entertainment_india,
+    "indian_express_entertainment": scrape_indian_express_entertainment_india,
+    "the_hindu_entertainment": scrape_the_hindu_entertainment_india,
+}
+
+global_source_map = {
+    "bbc_entertainment": scrape_bbc_entertainment_global,
+    "guardian_film": scrape_guardian_film_global,
+    "washington_post_entertainment": scrape_washington_post_entertainment_global,
+    "cnn_entertainment": scrape_cnn_entertainment_global,
+}
+
+async def scrape_entertainment_news_async(region="India", sources=None, deadline=DEFAULT_DEADLINE, errors=None):
     """
     Scrapes entertainment news from various sources based on the selected region.
     """
-    all_articles = []
-    
-    india_source_map = {
-        "india_today_entertainment": scrape_india_today_entertainment_india,
-        "financial_express_entertainment": scrape_financial_express_entertainment_india,
-        "ndtv_entertainment": scrape_ndtv_entertainment_india,
-        "deccan_herald_entertainment": scrape_deccan_herald_entertainment_india,
-        "hindustan_times_entertainment": scrape_hindustan_times_entertainment_india,
-        "times_of_india_entertainment": scrape_times_of_india_entertainment_india,
-        "indian_express_entertainment": scrape_indian_express_entertainment_india,
-        "the_hindu_entertainment": scrape_the_hindu_entertainment_india,
-    }
-    
-    global_source_map = {
-        "bbc_entertainment": scrape_bbc_entertainment_global,
-        "guardian_film": scrape_guardian_film_global,
-        "washington_post_entertainment": scrape_washington_post_entertainment_global,
-        "cnn_entertainment": scrape_cnn_entertainment_global,
-    }
-
-    if region == "India":
-        source_map = india_source_map
-    else: # Global
-        source_map = global_source_map
-
-    if sources is None:
-        sources = list(source_map.keys())
-
-    for src in sources:
-        func = source_map.get(src)
-        if func:
-            try:
-                src_articles = func()
-                print(f"Entertainment ({region} - {src}): {len(src_articles)} articles")
-                all_articles.extend(src_articles)
-                time.sleep(1) # Be polite
-            except Exception as e:
-                print(f"Error in scrape_entertainment_news for source {src}: {e}")
+    return await scrape_category_async("entertainment", india_source_map if region == "India" else global_source_map, region, sources, deadline, errors)
 
-    return all_articles
+def scrape_entertainment_news(region="India", sources=None, deadline=DEFAULT_DEADLINE, errors=None):
+    return run_sync(scrape_entertainment_news_async(region, sources, deadline=deadline, errors=errors))
 
 if __name__ == "__main__":
     print("\n--- Testing Indian Entertainment Sources ---\n")
@@ -1,18 +1,14 @@
-import time
-import requests
-from time import sleep
-from bs4 import BeautifulSoup
-
-def clean_text(text: str) -> str:
-    return ' '.join(text.strip().split())
-
-def get_http_session() -> requests.Session:
-    session = requests.Session()
-    session.headers.update({"User-Agent": "Mozilla/5.0"})
-    return session
-
-def normalize_title(title: str) -> str:
-    return clean_text(title.replace("\n", " ").replace("\xa0", " "))
+from urllib.parse import urlencode
+import http_client
+from pagination import paginate
+from functools import partial
+from keyword_matcher import compile_keywords
+from source_registry import register
+from source_runner import scrape_category_async, run_sync, DEFAULT_DEADLINE
+from title_normalizer import normalize as normalize_title
+
+def get_http_session() -> http_client.ClientSession:
+    return http_client.get_session({"User-Agent": "Mozilla/5.0"})
 
 def ensure_absolute_url(url: str) -> str:
     if url.startswith(('http://', 'https://')):
@@ -30,207 +26,121 @@ environment_keywords = [
     "nature", "natural disaster", "sanctuary", "project tiger", "plastic ban",
     "pollution control board", "jal shakti", "climate action", "unfccc", "paris agreement"
 ]
+environment_matcher = compile_keywords(environment_keywords)
+
+# Sources that are a plain headline-link list are declared, not hand-written.
+_source = partial(register, __name__, clean=normalize_title, session=get_http_session)
 
 #--------INDIAN NEWS-------------------
 
-def scrape_deccan_herald():
-    try:
-        session = get_http_session()
-        url = "https://www.deccanherald.com/specials/environment"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, 'html.parser')
-        articles = []
-        seen_titles = set()
-        for card in soup.find_all('div', class_='story-card-15'):
-            headline = card.find('h2', class_='headline')
-            if not headline:
-                continue
-            title = normalize_title(headline.text)
-            if not any(keyword in title.lower() for keyword in environment_keywords):
-                continue
-            a_tag = headline.find_parent('a')
-            if not a_tag:
-                continue
-            href = a_tag.get('href', '')
-            full_url = f"https://www.deccanherald.com{href}" if href.startswith('/') else href
-            if title not in seen_titles:
-                articles.append({"title": title, "url": full_url, "source": "Deccan Herald"})
-                seen_titles.add(title)
-        return articles
-    except Exception:
-        return []
+scrape_deccan_herald = _source(
+    "scrape_deccan_herald",
+    "Deccan Herald",
+    "https://www.deccanherald.com/specials/environment",
+    selectors=['div.story-card-15 a:has(h2.headline)'],
+    title_selector='h2.headline',
+    base_url="https://www.deccanherald.com",
+    keywords=environment_matcher,
+    unrooted="keep",
+)
+
+scrape_indian_express = _source(
+    "scrape_indian_express",
+    "Indian Express",
+    "https://indianexpress.com/about/environment/",
+    selectors=['h3 a[href]'],
+    # Only articles from the environment section
+    href_contains='/environment/',
+    unrooted="keep",
+)
+
+scrape_ndtv = _source(
+    "scrape_ndtv",
+    "NDTV",
+    "https://www.ndtv.com/topic/environment",
+    selectors=['h2 a', 'h3 a'],
+    base_url="https://www.ndtv.com",
+    keywords=environment_matcher,
+)
+
+scrape_hindustan_times = _source(
+    "scrape_hindustan_times",
+    "Hindustan Times",
+    # Pages 1 to 3
+    [
+        f"https://www.hindustantimes.com/environment/page-{page}" if page > 1 else "https://www.hindustantimes.com/environment"
+        for page in range(1, 4)
+    ],
+    selectors=['div.cartHolder.listView.track h3.hdg3 a[href]'],
+    base_url="https://www.hindustantimes.com",
+    unrooted="keep",
+)
 
+#--------GLOBAL NEWS-------------------
 
-def scrape_indian_express():
-    try:
-        session = get_http_session()
-        url = "https://indianexpress.com/about/environment/"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-        seen_titles = set()
-        for h3 in soup.find_all('h3'):
-            a_tag = h3.find('a', href=True)
-            if not a_tag:
-                continue
-            title = normalize_title(a_tag.get_text())
-            href = a_tag['href']
-            # Only include articles from the environment section
-            if '/environment/' not in href:
-                continue
-            if title and title not in seen_titles:
-                articles.append({"title": title, "url": href, "source": "Indian Express"})
-                seen_titles.add(title)
-        return articles
-    except Exception:
-        return []
 
-def scrape_ndtv():
-    try:
-        session = get_http_session()
-        url = "https://www.ndtv.com/topic/environment"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-        seen_titles = set()
-        for tag in soup.select("h2 a, h3 a"):
-            title = normalize_title(tag.get_text())
-            href = tag.get("href", "")
-            if not any(kw in title.lower() for kw in environment_keywords):
-                continue
-            if title and title not in seen_titles and href:
-                if href.startswith("/"):
-                    href = "https://www.ndtv.com" + href
-                elif not href.startswith("http"):
-                    continue
-                articles.append({"title": title, "url": href, "source": "NDTV"})
-                seen_titles.add(title)
-        return articles
-    except Exception:
-        return []
+scrape_cnbc = _source(
+    "scrape_cnbc",
+    "CNBC",
+    "https://www.cnbc.com/environment/",
+    selectors=['div[data-test="Card"] a.Card-title[href]'],
+    unrooted="keep",
+)
 
-def scrape_hindustan_times():
-    articles = []
-    seen_titles = set()
+# Hand-written: a JSON search API, not a headline page.
+def scrape_euronews(query="environment", max_pages=3):
+    api_url = "https://www.euronews.com/api/search"
     session = get_http_session()
-    try:
-        for page in range(1, 4):  # Scrape pages 1 to 3
-            url = f"https://www.hindustantimes.com/environment/page-{page}" if page > 1 else "https://www.hindustantimes.com/environment"
-            response = session.get(url, timeout=15)
-            soup = BeautifulSoup(response.content, "html.parser")
-            for div in soup.find_all('div', class_='cartHolder listView track '):
-                h3 = div.find('h3', class_='hdg3')
-                if not h3:
-                    continue
-                a_tag = h3.find('a', href=True)
-                if not a_tag:
-                    continue
-                title = normalize_title(a_tag.get_text())
-                href = a_tag['href']
-                if href.startswith('/'):
-                    href = "https://www.hindustantimes.com" + href
-                if title and title not in seen_titles:
-                    articles.append({"title": title, "url": href, "source": "Hindustan Times"})
-                    seen_titles.add(title)
-        return articles
-    except Exception:
-        return []
-
-#--------GLOBAL NEWS-------------------
 
-
-def scrape_cnbc():
-    url = "https://www.cnbc.com/environment/"
-    headers = {"User-Agent": "Mozilla/5.0"}
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
+    def fetch_page(page_url):
+        res = session.get(page_url, timeout=15)
+        res.raise_for_status()
+        results = res.json()
         articles = []
-        seen_titles = set()
-        for card in soup.find_all("div", attrs={"data-test": "Card"}):
-            title_tag = card.find("a", class_="Card-title")
-            if title_tag and title_tag.text and title_tag['href']:
-                title = clean_text(title_tag.text)
-                href = title_tag['href']
-                if title not in seen_titles:
-                    articles.append({"title": title, "url": href, "source": "CNBC"})
-                    seen_titles.add(title)
-        return articles
-    except Exception:
-        return []
-
-def scrape_euronews(query="environment", max_pages=3, delay=0.3):
-    api_url = "https://www.euronews.com/api/search"
-    headers = {"User-Agent": "Mozilla/5.0"}
-    articles = []
-    for page in range(1, max_pages + 1):
-        params = {"query": query, "page": page, "size": 10}
-        try:
-            res = requests.get(api_url, headers=headers, params=params, timeout=15)
-            res.raise_for_status()
-            results = res.json()
-            if not isinstance(results, list) or not results:
-                break
-        except Exception:
-            break
+        if not isinstance(results, list):
+            return articles
         for item in results:
-            title = clean_text(item.get("title", ""))
+            title = normalize_title(item.get("title", ""))
             url = ensure_absolute_url(item.get("url", ""))
             if title and url:
                 articles.append({"title": title, "url": url, "source": "Euronews"})
-        sleep(delay)
-    return articles
+        return articles
 
-def scrape_guardian():
+    urls = [f"{api_url}?{urlencode({'query': query, 'page': page, 'size': 10})}" for page in range(1, max_pages + 1)]
     try:
-        session = get_http_session()
-        url = "https://www.theguardian.com/environment"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-        seen_titles = set()
-        for tag in soup.select('a[aria-label]'):
-            title = normalize_title(tag.get("aria-label"))
-            href = tag.get("href", "")
-            if title and href and "/202" in href and title not in seen_titles:
-                full_url = href if href.startswith("http") else "https://www.theguardian.com" + href
-                articles.append({"title": title, "url": full_url, "source": "The Guardian"})
-                seen_titles.add(title)
-        return articles
+        return paginate(urls, fetch_page)
     except Exception:
         return []
 
-
-def scrape_environment_news(region="India", sources=None):
-    india_source_map = {
-        "deccan_herald": scrape_deccan_herald,
-        "indian_express": scrape_indian_express,
-        "ndtv": scrape_ndtv,
-        "hindustan_times": scrape_hindustan_times,
-    }
-    global_source_map = {
-        "euronews": scrape_euronews,
-        "cnbc": scrape_cnbc,
-        "guardian": scrape_guardian,
-    }
-    if region == "India":
-        source_map = india_source_map
-    else:
-        source_map = global_source_map
-    if sources is None:
-        sources = list(source_map.keys())
-    all_articles = []
-    for src in sources:
-        func = source_map.get(src)
-        if func:
-            try:
-                # euronews takes a query, others do not
-                src_articles = func() if src != "euronews" else func()
-                all_articles.extend(src_articles)
-            except Exception as e:
-                print(f"Error in scrape_environment_news for source {src}: {e}")
-    return all_articles
+scrape_guardian = _source(
+    "scrape_guardian",
+    "The Guardian",
+    "https://www.theguardian.com/environment",
+    selectors=['a[aria-label]'],
+    title_attr='aria-label',
+    href_contains='/202',
+    base_url="https://www.theguardian.com",
+    unrooted="join",
+)
+
+india_source_map = {
+    "deccan_herald": scrape_deccan_herald,
+    "indian_express": scrape_indian_express,
+    "ndtv": scrape_ndtv,
+    "hindustan_times": scrape_hindustan_times,
+}
+
+global_source_map = {
+    "euronews": scrape_euronews,
+    "cnbc": scrape_cnbc,
+    "guardian": scrape_guardian,
+}
+
+async def scrape_environment_news_async(region="India", sources=None, deadline=DEFAULT_DEADLINE, errors=None):
+    return await scrape_category_async("environment", india_source_map if region == "India" else global_source_map, region, sources, deadline, errors)
+
+def scrape_environment_news(region="India", sources=None, deadline=DEFAULT_DEADLINE, errors=None):
+    return run_sync(scrape_environment_news_async(region, sources, deadline=deadline, errors=errors))
 
 if __name__ == "__main__":
     print("--- Scraping India Environment News ---")
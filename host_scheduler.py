@@ -0,0 +1,171 @@
+# host_scheduler.py
+import os
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+# Minimum spacing between two requests to the same host. Requests to
+# different hosts never wait on each other.
+MIN_INTERVAL = float(os.getenv("NEWS_HOST_MIN_INTERVAL", "1.0"))
+# Per-host concurrency adapts between MIN_CONCURRENCY and MAX_CONCURRENCY
+# (AIMD): +1 per window of healthy responses, halved on 429s, 5xx,
+# connection errors, timeouts or a latency spike (LATENCY_SPIKE x the usual
+# latency). Timeouts cut short by a caller's deadline are not reported.
+MAX_CONCURRENCY = int(os.getenv("NEWS_HOST_MAX_CONCURRENCY", "8"))
+MIN_CONCURRENCY = int(os.getenv("NEWS_HOST_MIN_CONCURRENCY", "1"))
+INITIAL_CONCURRENCY = int(os.getenv("NEWS_HOST_INITIAL_CONCURRENCY", "4"))
+DECREASE_FACTOR = 0.5
+LATENCY_SPIKE = float(os.getenv("NEWS_HOST_LATENCY_SPIKE", "2.5"))
+# ...and at least this many seconds above it, so jitter on fast hosts is ignored.
+LATENCY_SPIKE_MIN = float(os.getenv("NEWS_HOST_LATENCY_SPIKE_MIN", "0.5"))
+_EWMA_ALPHA = 0.2
+
+
+class HostLimiter:
+    """
+    Adaptive in-flight limit for one host. `acquire`/`release` bracket a
+    request; `record` feeds back its latency and status code (None for a
+    request that raised).
+    """
+
+    def __init__(self, initial=INITIAL_CONCURRENCY, minimum=MIN_CONCURRENCY, maximum=MAX_CONCURRENCY):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.in_flight = 0
+        self.latency = None  # EWMA over every response
+        self.baseline = None  # EWMA over responses that were not spikes
+        self.decreases = 0
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self, deadline=None):
+        """
+        Waits for a free slot; False (and no slot taken) if none frees up
+        before `deadline` (a time.monotonic() value).
+        """
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                if deadline is None:
+                    self._cond.wait()
+                    continue
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    return False
+                self._cond.wait(left)
+            self.in_flight += 1
+            return True
+
+    def release(self):
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def record(self, latency, status):
+        with self._cond:
+            self.latency = latency if self.latency is None else (
+                _EWMA_ALPHA * latency + (1 - _EWMA_ALPHA) * self.latency)
+            spike = self.baseline is not None and latency > max(LATENCY_SPIKE * self.baseline,
+                                                                self.baseline + LATENCY_SPIKE_MIN)
+            if not spike:
+                self.baseline = latency if self.baseline is None else (
+                    _EWMA_ALPHA * latency + (1 - _EWMA_ALPHA) * self.baseline)
+
+            if status is None or status == 429 or status >= 500 or spike:
+                # One cut per round trip: a burst of failures from requests
+                # that were already in flight together counts once.
+                now = time.monotonic()
+                if now - self._last_decrease >= (self.baseline or latency):
+                    self.limit = max(self.minimum, self.limit * DECREASE_FACTOR)
+                    self.decreases += 1
+                    self._last_decrease = now
+            else:
+                self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+            self._cond.notify_all()
+
+    def snapshot(self):
+        with self._cond:
+            return {
+                "limit": int(self.limit),
+                "in_flight": self.in_flight,
+                "latency": self.latency,
+                "baseline_latency": self.baseline,
+                "decreases": self.decreases,
+            }
+
+
+_lock = threading.Lock()
+_intervals = {}
+_next_slot = {}
+_limiters = {}
+
+
+def host_key(url):
+    host = (urlsplit(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def set_interval(host, seconds):
+    with _lock:
+        _intervals[host_key(f"//{host}")] = seconds
+
+
+def wait_turn(url, deadline=None):
+    """
+    Blocks until `url`'s host may be contacted again. Callers reserve the
+    next free slot under the lock and sleep outside it, so concurrent
+    requests to one host are spaced out while other hosts proceed freely.
+    Returns the seconds waited, or None without reserving anything if the
+    next slot is not before `deadline` (a time.monotonic() value).
+    """
+    host = host_key(url)
+    with _lock:
+        interval = _intervals.get(host, MIN_INTERVAL)
+        now = time.monotonic()
+        slot = max(now, _next_slot.get(host, 0.0))
+        if deadline is not None and slot >= deadline:
+            return None
+        _next_slot[host] = slot + interval
+    delay = slot - now
+    if delay > 0:
+        time.sleep(delay)
+    return delay
+
+
+def _limiter(url):
+    host = host_key(url)
+    with _lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = _limiters[host] = HostLimiter()
+    return limiter
+
+
+def concurrency_limit(url):
+    return int(_limiter(url).limit)
+
+
+@contextmanager
+def host_slot(url, deadline=None):
+    """Holds one of the host's in-flight slots; yields False if none was free before `deadline`."""
+    limiter = _limiter(url)
+    if not limiter.acquire(deadline):
+        yield False
+        return
+    try:
+        yield True
+    finally:
+        limiter.release()
+
+
+def record(url, latency, status):
+    """Feeds a finished request's latency and status (None if it raised) back to its host."""
+    _limiter(url).record(latency, status)
+
+
+def host_stats():
+    """Current concurrency limit, in-flight count and latencies per host."""
+    with _lock:
+        limiters = dict(_limiters)
+    return {host: limiter.snapshot() for host, limiter in limiters.items()}
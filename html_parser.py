@@ -0,0 +1,217 @@
+# html_parser.py
+import ast
+import importlib.util
+import inspect
+import os
+import re
+import textwrap
+import threading
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+# Tree builder used for every scraped page: "lxml" (C, fast), "html.parser"
+# (pure Python, always available) or "html5lib". Missing backends fall back
+# to html.parser.
+DEFAULT_BACKEND = os.getenv("NEWS_HTML_PARSER", "lxml")
+FALLBACK_BACKEND = "html.parser"
+# Build only the elements an extractor's selectors can reach (see strainer_for).
+STRAIN = os.getenv("NEWS_PARSE_STRAIN", "1") != "0"
+
+_MODULES = {"lxml": "lxml", "html5lib": "html5lib", "selectolax": "selectolax", FALLBACK_BACKEND: None}
+_available = {}
+_warned = set()
+
+
+def available(backend):
+    if backend not in _available:
+        module = _MODULES.get(backend, backend)
+        _available[backend] = module is None or importlib.util.find_spec(module) is not None
+    return _available[backend]
+
+
+def resolve(backend=None):
+    """Returns the BeautifulSoup builder to use for `backend` (default: DEFAULT_BACKEND)."""
+    backend = backend or DEFAULT_BACKEND
+    if backend == "selectolax" or not available(backend):
+        if backend not in _warned:
+            _warned.add(backend)
+            print(f"[html_parser] '{backend}' is not usable as a soup builder, falling back to {FALLBACK_BACKEND}")
+        return FALLBACK_BACKEND
+    return backend
+
+
+def make_soup(body, backend=None, parse_only=None):
+    """The one place scraped pages are turned into a BeautifulSoup tree."""
+    return BeautifulSoup(body, resolve(backend), parse_only=parse_only)
+
+
+_TAG_RE = re.compile(r"\s*([a-zA-Z][a-zA-Z0-9-]*)")
+_SOUP_METHODS = {"select", "select_one", "find", "find_all"}
+# Navigation that can leave the subtree a selector matched; the tree must be whole.
+_OUTWARD = {
+    "parent", "parents", "find_parent", "find_parents", "next", "previous", "next_sibling", "previous_sibling",
+    "next_siblings", "previous_siblings", "next_element", "previous_element",
+    "find_next", "find_all_next", "find_next_sibling", "find_next_siblings",
+    "find_previous", "find_all_previous", "find_previous_sibling", "find_previous_siblings",
+}
+_strainers = {}
+_strainers_lock = threading.Lock()
+
+
+# Pseudo-classes whose answer depends on siblings the strainer would drop.
+_SIBLING_PSEUDO_RE = re.compile(r":(nth-|first-|last-|only-)")
+
+
+def _split_first_compound(part):
+    """("h3.title", "> a") for "h3.title > a"; brackets, parens and quotes are skipped over."""
+    depth = 0
+    quote = None
+    for i, char in enumerate(part):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char in "[(":
+            depth += 1
+        elif char in "])":
+            depth -= 1
+        elif depth == 0 and (char.isspace() or char in ">+~"):
+            return part[:i], part[i:].strip()
+    return part, ""
+
+
+def tags_for_selectors(selectors):
+    """
+    Element types that must be built for `selectors` to match: the tag of
+    each selector's outermost compound ("h3" for "h3.title > a"), since
+    everything below a kept element is kept too. None if any selector
+    starts without a tag name (".story a", "[data-x]"), which could be
+    anything, or reaches the first compound's siblings ("h3 + a",
+    "li:nth-child(2) a"), which are not below it.
+    """
+    tags = set()
+    for selector in selectors:
+        for part in selector.split(","):
+            part = part.strip()
+            match = _TAG_RE.match(part)
+            if not match or part[match.end():match.end() + 1] not in ("", " ", ".", "#", "[", ":", ">", "~", "+"):
+                return None
+            compound, rest = _split_first_compound(part)
+            if rest[:1] in ("+", "~") or _SIBLING_PSEUDO_RE.search(compound):
+                return None
+            tags.add(match.group(1).lower())
+    return tags
+
+
+def _string_list(node):
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return [node.value]
+    if isinstance(node, (ast.List, ast.Tuple)) and all(
+            isinstance(elt, ast.Constant) and isinstance(elt.value, str) for elt in node.elts):
+        return [elt.value for elt in node.elts]
+    return None
+
+
+def _soup_tags(extract):
+    """Tags `extract(soup)` needs, read off its source; None if it can't be told."""
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(extract)))
+    except (OSError, TypeError, SyntaxError):
+        return None
+    func = tree.body[0]
+    if not isinstance(func, ast.FunctionDef) or len(func.args.args) != 1:
+        return None
+    soup_name = func.args.args[0].arg
+
+    # Selector strings reachable through simple names: `selectors = [...]`
+    # and `for selector in selectors:`.
+    names = {}
+    for node in ast.walk(func):
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            values = _string_list(node.value)
+            if values is not None:
+                names[node.targets[0].id] = values
+    for node in ast.walk(func):
+        if isinstance(node, ast.For) and isinstance(node.target, ast.Name) and isinstance(node.iter, ast.Name):
+            if node.iter.id in names:
+                names[node.target.id] = names[node.iter.id]
+
+    receivers = set()
+    tags = set()
+    for node in ast.walk(func):
+        if isinstance(node, ast.Attribute) and node.attr in _OUTWARD:
+            return None
+        if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                and isinstance(node.func.value, ast.Name) and node.func.value.id == soup_name):
+            continue
+        receivers.add(id(node.func.value))
+        method = node.func.attr
+        if method not in _SOUP_METHODS or not node.args:
+            return None
+        arg = node.args[0]
+        values = names.get(arg.id) if isinstance(arg, ast.Name) else _string_list(arg)
+        if values is None:
+            return None
+        found = tags_for_selectors(values) if method.startswith("select") else {v.lower() for v in values}
+        if found is None:
+            return None
+        tags |= found
+
+    # The soup must not be used any other way (passed on, iterated, ...).
+    for node in ast.walk(func):
+        if isinstance(node, ast.Name) and node.id == soup_name and id(node) not in receivers:
+            return None
+    return tags or None
+
+
+def strainer_for(extract):
+    """
+    SoupStrainer limiting the build to what `extract` selects, derived
+    once from its selector list; None (full tree) when that isn't safe.
+    """
+    if not STRAIN:
+        return None
+    with _strainers_lock:
+        if extract in _strainers:
+            return _strainers[extract]
+    # Declared sources (source_registry.SourceSpec) carry their selectors.
+    selectors = getattr(extract, "selectors", None)
+    tags = tags_for_selectors(selectors) if selectors is not None else _soup_tags(extract)
+    strainer = SoupStrainer(sorted(tags)) if tags else None
+    with _strainers_lock:
+        _strainers[extract] = strainer
+    return strainer
+
+
+class Node:
+    """Minimal element returned by `css`: its text and attributes."""
+
+    __slots__ = ("text", "attrs")
+
+    def __init__(self, text, attrs):
+        self.text = text
+        self.attrs = attrs
+
+    def get(self, name, default=None):
+        return self.attrs.get(name, default)
+
+
+def css(body, selector, backend=None):
+    """
+    Fast path for extraction that only needs CSS selection plus each
+    match's text and attributes. Uses selectolax (lexbor) when installed
+    and asked for, otherwise the regular soup.
+    """
+    backend = backend or DEFAULT_BACKEND
+    if backend == "selectolax" and available("selectolax"):
+        from selectolax.lexbor import LexborHTMLParser
+
+        tree = LexborHTMLParser(body)
+        return [Node(node.text(deep=True), dict(node.attributes)) for node in tree.css(selector)]
+    soup = make_soup(body, backend)
+    return [
+        Node(tag.get_text(), {name: " ".join(value) if isinstance(value, list) else value
+                              for name, value in tag.attrs.items()})
+        for tag in soup.select(selector)
+    ]
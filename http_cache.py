@@ -0,0 +1,205 @@
+# http_cache.py
+import hashlib
+import json
+import os
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+CACHE_DIR = os.getenv(
+    "NEWS_HTTP_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".http_cache")
+)
+ENABLED = os.getenv("NEWS_HTTP_CACHE", "1") != "0"
+# Entries older than this are dropped rather than revalidated, and the
+# oldest go first once the directory outgrows MAX_BYTES.
+MAX_AGE = float(os.getenv("NEWS_HTTP_CACHE_MAX_AGE", str(7 * 86400)))
+MAX_BYTES = int(os.getenv("NEWS_HTTP_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+# Seconds between prunes triggered by store().
+PRUNE_INTERVAL = 600
+
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+# Describe the bytes on the wire, not the decoded body we replay.
+_DROPPED_HEADERS = ("Content-Length", "Content-Encoding", "Transfer-Encoding")
+
+_lock = threading.Lock()
+_stats = {"revalidated": 0, "not_modified": 0, "stored": 0, "bytes_saved": 0, "pruned": 0}
+_last_prune = 0.0
+
+
+def record(name, amount=1):
+    with _lock:
+        _stats[name] += amount
+
+
+def stats():
+    with _lock:
+        return dict(_stats)
+
+
+def _paths(url):
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    base = os.path.join(CACHE_DIR, key[:2], key)
+    return base + ".json", base + ".body"
+
+
+def load(url):
+    """
+    The stored validators for `url`, or None. The body stays on disk until
+    replay() needs it; most revalidations end in a 200 that replaces it.
+    """
+    if not ENABLED:
+        return None
+    meta_path, body_path = _paths(url)
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if time.time() - meta.get("stored_at", 0) > MAX_AGE:
+        _remove(meta_path, body_path)
+        return None
+    meta["body_path"] = body_path
+    return meta
+
+
+def conditional_headers(entry):
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def store(url, response):
+    """Stores a 200 response that carries validators; others are ignored."""
+    if not ENABLED or response.status_code != 200:
+        return
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return
+    meta_path, body_path = _paths(url)
+    meta = {
+        "url": url,
+        "etag": etag,
+        "last_modified": last_modified,
+        "encoding": response.encoding,
+        "headers": {name: response.headers[name] for name in _KEPT_HEADERS if name in response.headers},
+        "stored_at": time.time(),
+    }
+    try:
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        # Write to temp files and rename so readers never see half an entry.
+        for path, mode, data in ((body_path, "wb", response.content), (meta_path, "w", json.dumps(meta))):
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, mode) as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        record("stored")
+    except OSError as e:
+        print(f"[http_cache] Could not store {url}: {e}")
+    _maybe_prune()
+
+
+def replay(response, entry):
+    """
+    Turns a 304 into a 200 carrying the stored body, or returns None if the
+    body has gone (pruned or cleared since load()).
+    """
+    try:
+        with open(entry["body_path"], "rb") as f:
+            body = f.read()
+    except OSError:
+        return None
+    cached = requests.Response()
+    cached.status_code = 200
+    cached._content = body
+    cached.headers = CaseInsensitiveDict(entry.get("headers", {}))
+    for name, value in response.headers.items():
+        if name.title() not in _DROPPED_HEADERS:
+            cached.headers[name] = value
+    cached.encoding = entry.get("encoding")
+    cached.url = response.url
+    cached.request = response.request
+    cached.history = response.history
+    cached.elapsed = response.elapsed
+    cached.reason = "OK"
+    cached.from_cache = True
+    record("not_modified")
+    record("bytes_saved", len(body))
+    return cached
+
+
+def _remove(*paths):
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _maybe_prune():
+    global _last_prune
+    now = time.monotonic()
+    with _lock:
+        if now - _last_prune < PRUNE_INTERVAL:
+            return
+        _last_prune = now
+    prune()
+
+
+def prune(max_age=None, max_bytes=None):
+    """
+    Deletes entries stored more than `max_age` seconds ago, then the oldest
+    remaining ones until the cache fits in `max_bytes`; returns how many went.
+    """
+    max_age = MAX_AGE if max_age is None else max_age
+    max_bytes = MAX_BYTES if max_bytes is None else max_bytes
+    now = time.time()
+    entries, total, removed = [], 0, 0
+    for root, _, files in os.walk(CACHE_DIR):
+        for name in files:
+            path = os.path.join(root, name)
+            if name.endswith(".tmp"):
+                # Left behind by a writer that died mid-store.
+                try:
+                    if now - os.path.getmtime(path) > PRUNE_INTERVAL:
+                        _remove(path)
+                except OSError:
+                    pass
+                continue
+            if not name.endswith(".json"):
+                continue
+            body_path = path[: -len(".json")] + ".body"
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    stored_at = json.load(f).get("stored_at", 0)
+                size = os.path.getsize(path) + os.path.getsize(body_path)
+            except (OSError, ValueError):
+                stored_at, size = 0, 0
+            if now - stored_at > max_age:
+                _remove(path, body_path)
+                removed += 1
+            else:
+                entries.append((stored_at, size, path, body_path))
+                total += size
+    entries.sort()
+    for _, size, path, body_path in entries:
+        if total <= max_bytes:
+            break
+        _remove(path, body_path)
+        total -= size
+        removed += 1
+    if removed:
+        record("pruned", removed)
+        print(f"[http_cache] Pruned {removed} entries, {total // 1024} KiB left")
+    return removed
+
+
+def clear():
+    for root, _, files in os.walk(CACHE_DIR):
+        for name in files:
+            os.remove(os.path.join(root, name))
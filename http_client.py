@@ -0,0 +1,285 @@
+# http_client.py
+import contextvars
+import os
+import random
+import socket
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NameResolutionError
+
+import host_scheduler
+import http_cache
+from singleflight import FlightTimeout, SingleFlight
+
+# Number of per-host pools kept alive, and connections kept per host.
+POOL_CONNECTIONS = int(os.getenv("NEWS_HTTP_POOL_CONNECTIONS", "64"))
+POOL_MAXSIZE = int(os.getenv("NEWS_HTTP_POOL_MAXSIZE", "8"))
+
+# Extra attempts for idempotent requests that hit a transient failure, and
+# the exponential backoff between them (full jitter, capped).
+MAX_RETRIES = int(os.getenv("NEWS_HTTP_RETRIES", "2"))
+BACKOFF_BASE = float(os.getenv("NEWS_HTTP_BACKOFF_BASE", "0.5"))
+BACKOFF_MAX = float(os.getenv("NEWS_HTTP_BACKOFF_MAX", "8"))
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_METHODS = {"GET", "HEAD"}
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+_lock = threading.Lock()
+_session = None
+_adapter = None
+# Absolute time.monotonic() by which the current digest/source must finish.
+_deadline = contextvars.ContextVar("http_deadline", default=None)
+
+
+class DeadlineExceeded(requests.exceptions.Timeout):
+    pass
+
+
+# A GET cut off by its caller's deadline is retried by waiters with time left.
+_flights = SingleFlight(deadline_errors=(DeadlineExceeded,))
+
+
+def set_deadline(deadline):
+    """Sets the deadline for requests made from the current context."""
+    return _deadline.set(deadline)
+
+
+def remaining():
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def _build_session(pool_connections, pool_maxsize):
+    # One adapter serves every host: urllib3 keeps a keep-alive pool per
+    # host inside it, so TCP/TLS connections are reused across sources,
+    # categories and requests instead of being thrown away with each Session.
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session, adapter
+
+
+def get_shared_session():
+    global _session, _adapter
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session, _adapter = _build_session(POOL_CONNECTIONS, POOL_MAXSIZE)
+    return _session
+
+
+def configure(pool_connections=None, pool_maxsize=None):
+    """Rebuilds the shared session with new pool sizes."""
+    global POOL_CONNECTIONS, POOL_MAXSIZE, _session, _adapter
+    with _lock:
+        if pool_connections is not None:
+            POOL_CONNECTIONS = pool_connections
+        if pool_maxsize is not None:
+            POOL_MAXSIZE = pool_maxsize
+        old = _session
+        _session, _adapter = _build_session(POOL_CONNECTIONS, POOL_MAXSIZE)
+    if old is not None:
+        old.close()
+
+
+def _retry_after(response):
+    """Seconds asked for by a 429/503 Retry-After header, or None."""
+    if response.status_code not in (429, 503):
+        return None
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _name_unresolved(error):
+    """Whether a ConnectionError comes from a failed DNS lookup, somewhere down its cause chain."""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, (NameResolutionError, socket.gaierror)):
+            return True
+        nested = getattr(error, "reason", None)
+        if nested is None and error.args and isinstance(error.args[0], BaseException):
+            nested = error.args[0]
+        error = nested or error.__cause__ or error.__context__
+    return False
+
+
+def _backoff(attempt):
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+def _send_once(method, url, headers=None, **kwargs):
+    deadline = _deadline.get()
+    # Work abandoned at a deadline stops at its next request instead of
+    # running on in the background.
+    if deadline is not None and deadline <= time.monotonic():
+        raise DeadlineExceeded(f"Deadline passed before {method} {url}")
+    with host_scheduler.host_slot(url, deadline) as acquired:
+        if not acquired or host_scheduler.wait_turn(url, deadline) is None:
+            raise DeadlineExceeded(f"No turn at {host_scheduler.host_key(url)} before the deadline for {method} {url}")
+        # Clip the timeout to what is left after queueing for the host.
+        left = remaining()
+        clipped = False
+        if left is not None:
+            if left <= 0:
+                raise DeadlineExceeded(f"Deadline passed before {method} {url}")
+            timeout = kwargs.get("timeout")
+            clipped = timeout is None or left < timeout
+            kwargs["timeout"] = left if clipped else timeout
+        start = time.monotonic()
+        try:
+            response = get_shared_session().request(method, url, headers=headers, **kwargs)
+        except requests.exceptions.Timeout:
+            # Running out of our own budget says nothing about the host's load.
+            if not clipped:
+                host_scheduler.record(url, time.monotonic() - start, None)
+            raise
+        except requests.exceptions.RequestException:
+            host_scheduler.record(url, time.monotonic() - start, None)
+            raise
+        host_scheduler.record(url, time.monotonic() - start, response.status_code)
+        return response
+
+
+def _send(method, url, headers=None, **kwargs):
+    retries = MAX_RETRIES if method in RETRY_METHODS else 0
+    attempt = 0
+    while True:
+        try:
+            response = _send_once(method, url, headers=headers, **kwargs)
+        except DeadlineExceeded:
+            raise
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            # A host that doesn't resolve won't a second later either.
+            if attempt >= retries or _name_unresolved(e):
+                raise
+            delay = _backoff(attempt)
+            reason = type(e).__name__
+            response = None
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt >= retries:
+                return response
+            retry_after = _retry_after(response)
+            if retry_after is not None and retry_after > BACKOFF_MAX:
+                return response
+            delay = _backoff(attempt) if retry_after is None else retry_after
+            reason = response.status_code
+
+        # Never sleep past the caller's deadline; hand back what we have.
+        left = remaining()
+        if left is not None and delay >= left:
+            if response is not None:
+                return response
+            raise DeadlineExceeded(f"No time left to retry {method} {url} after {reason}")
+        if response is not None:
+            response.close()
+        attempt += 1
+        print(f"[http_client] {method} {url} failed ({reason}), retry {attempt}/{retries} in {delay:.1f}s")
+        time.sleep(delay)
+
+
+def request(method, url, headers=None, **kwargs):
+    if method != "GET" or kwargs.get("stream"):
+        return _send(method, url, headers=headers, **kwargs)
+
+    # Revalidate against the on-disk copy; a 304 replays the stored body.
+    cache_url = requests.Request(method, url, params=kwargs.get("params")).prepare().url
+    entry = http_cache.load(cache_url)
+    send_headers = headers
+    if entry is not None:
+        send_headers = dict(headers or {})
+        send_headers.update(http_cache.conditional_headers(entry))
+        http_cache.record("revalidated")
+    response = _send(method, url, headers=send_headers, **kwargs)
+    if response.status_code == 304 and entry is not None:
+        replayed = http_cache.replay(response, entry)
+        if replayed is not None:
+            return replayed
+        # The stored body went away under us; fetch it in full.
+        response.close()
+        response = _send(method, url, headers=headers, **kwargs)
+    http_cache.store(cache_url, response)
+    return response
+
+
+def get(url, headers=None, **kwargs):
+    if kwargs.get("stream"):
+        return request("GET", url, headers=headers, **kwargs)
+    # Identical GETs already in flight (same URL, query and headers, since
+    # User-Agent or Referer can change the page) share one response rather
+    # than hitting the host twice. Waiting counts against the deadline.
+    params = kwargs.get("params")
+    key = (
+        url,
+        tuple(sorted(params.items())) if isinstance(params, dict) else params,
+        tuple(sorted((name.lower(), value) for name, value in (headers or {}).items())),
+    )
+    try:
+        response, _ = _flights.do(key, lambda: request("GET", url, headers=headers, **kwargs), timeout=remaining())
+    except FlightTimeout as e:
+        raise DeadlineExceeded(f"No time left waiting for GET {url}") from e
+    return response
+
+
+class ClientSession:
+    """
+    Drop-in stand-in for a requests.Session that sends through the shared
+    pool. Each instance carries its own default headers, so callers may
+    still do `session.headers.update(...)` without affecting anyone else.
+    """
+
+    def __init__(self, headers=None):
+        self.headers = dict(DEFAULT_HEADERS)
+        if headers:
+            self.headers.update(headers)
+
+    def get(self, url, headers=None, **kwargs):
+        merged = dict(self.headers)
+        if headers:
+            merged.update(headers)
+        return get(url, headers=merged, **kwargs)
+
+
+def get_session(headers=None):
+    return ClientSession(headers)
+
+
+def pool_stats():
+    """
+    Per-host connection counters for the live pools: `requests` sent,
+    `connections` opened and `reused` = requests that went out on an
+    already-open connection.
+    """
+    get_shared_session()
+    stats = {}
+    pools = _adapter.poolmanager.pools
+    for key in list(pools.keys()):
+        pool = pools.get(key)
+        if pool is None:
+            continue
+        entry = stats.setdefault(pool.host, {"requests": 0, "connections": 0, "reused": 0})
+        entry["requests"] += pool.num_requests
+        entry["connections"] += pool.num_connections
+    for entry in stats.values():
+        entry["reused"] = max(0, entry["requests"] - entry["connections"])
+    return stats
@@ -0,0 +1,61 @@
+# keyword_matcher.py
+import re
+import threading
+
+_lock = threading.Lock()
+_compiled = {}
+
+
+class KeywordMatcher:
+    """
+    A category keyword list compiled into one case-insensitive regex.
+    Keywords match as whole words or phrases ("ai" does not match "said"),
+    optionally followed by a plural "s"/"es" ("hospital" matches
+    "hospitals"). Matched terms are reported in the keyword list's own
+    spelling, so "ICU" and "AIIMS" match however a title writes them.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = list(keywords)
+        self._canonical = {}
+        for keyword in self.keywords:
+            self._canonical.setdefault(keyword.lower(), keyword)
+        # Longest first so "mental health" wins over "health" at the same spot.
+        alternation = "|".join(
+            re.escape(keyword).replace(r"\ ", r"\s+")
+            for keyword in sorted(self._canonical, key=len, reverse=True)
+        )
+        self._pattern = re.compile(rf"(?<!\w)({alternation})(?:e?s)?(?!\w)", re.IGNORECASE)
+
+    def search(self, text):
+        """True if `text` contains any keyword."""
+        return bool(text) and self._pattern.search(text) is not None
+
+    def matches(self, text):
+        """Distinct keywords found in `text`, in order of first appearance."""
+        if not text:
+            return []
+        found = []
+        for match in self._pattern.finditer(text):
+            keyword = self._canonical[re.sub(r"\s+", " ", match.group(1).lower())]
+            if keyword not in found:
+                found.append(keyword)
+        return found
+
+    def match_many(self, texts):
+        """`matches` for a batch of titles, one list per title."""
+        return [self.matches(text) for text in texts]
+
+    def filter(self, texts):
+        """The titles in `texts` that contain any keyword."""
+        return [text for text in texts if self.search(text)]
+
+
+def compile_keywords(keywords):
+    """Shared, compiled-once matcher for a keyword list."""
+    key = tuple(keywords)
+    with _lock:
+        matcher = _compiled.get(key)
+        if matcher is None:
+            matcher = _compiled[key] = KeywordMatcher(keywords)
+    return matcher
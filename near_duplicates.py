@@ -0,0 +1,178 @@
+# near_duplicates.py
+import os
+import re
+import zlib
+from functools import lru_cache
+
+# Word-set Jaccard similarity at which two headlines count as the same story.
+# Outlets word the same story differently ("Govt hikes repo rate by 25 bps" /
+# "RBI raises repo rate 25 basis points" is 5 of 7 words once synonyms are
+# folded), while headlines about different events that share most of their
+# words ("CBSE Class 10 results declared" / "CBSE Class 12 ...") are told
+# apart by the number and direction guards in cluster().
+THRESHOLD = float(os.getenv("NEWS_DEDUP_THRESHOLD", "0.7"))
+# MinHash signature length, split into bands of ROWS hashes for bucketing.
+# With 32 hashes in bands of 2, a pair at 0.7 similarity shares a bucket
+# with >99.99% probability; every candidate is then checked against the
+# exact similarity.
+NUM_HASHES = int(os.getenv("NEWS_DEDUP_HASHES", "32"))
+ROWS = 2
+
+_MERSENNE = (1 << 61) - 1
+_MASK = (1 << 32) - 1
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_NUMBER_RE = re.compile(r"\d+(?:[.,]\d+)*")
+# Headlines that agree on everything but the direction are different news.
+_DIRECTIONS = {
+    "up": "rise rises rising rose risen gain gains gained jump jumps jumped surge surges surged soar soars "
+          "soared climb climbs climbed rally rallies rallied up higher above high hike hikes hiked "
+          "raise raises raised increase increases increased win wins won beat beats",
+    "down": "fall falls falling fell fallen drop drops dropped dip dips dipped slip slips slipped slump "
+            "slumps slumped plunge plunges plunged tumble tumbles tumbled decline declines declined "
+            "crash crashes crashed down lower below low cut cuts decrease decreases decreased "
+            "lose loses lost",
+}
+_DIRECTION_OF = {word: direction for direction, words in _DIRECTIONS.items() for word in words.split()}
+# Words outlets use interchangeably, folded to one token before comparing:
+# every verb of a direction counts as the same word ("hikes" == "raises").
+_CANONICAL = {word: f"~{direction}" for word, direction in _DIRECTION_OF.items()}
+_CANONICAL.update({"government": "govt", "bp": "bps"})
+_PHRASE_RE = re.compile(r"\bbasis points?\b")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in into is it its of on or over says "
+    "than that the this to up was were will with after amid".split()
+)
+
+
+def _permutations(count):
+    # Fixed (a, b) pairs so signatures are stable across processes and runs.
+    params = []
+    seed = 0x9E3779B97F4A7C15
+    for _ in range(count):
+        seed = (seed * 6364136223846793005 + 1442695040888963407) & ((1 << 64) - 1)
+        a = (seed >> 3) % _MERSENNE or 1
+        seed = (seed * 6364136223846793005 + 1442695040888963407) & ((1 << 64) - 1)
+        params.append((a, (seed >> 3) % _MERSENNE))
+    return params
+
+
+_PERMUTATIONS = _permutations(NUM_HASHES)
+
+
+def tokens(title):
+    """Content words of a headline, lowercased."""
+    return frozenset(w for w in _WORD_RE.findall(title.lower()) if w not in _STOPWORDS)
+
+
+def folded_tokens(title):
+    """
+    tokens() with words outlets use interchangeably folded together, for
+    comparing headlines; sent_store's fingerprints stay on the plain words.
+    """
+    text = _PHRASE_RE.sub("bps", title.lower())
+    return frozenset(_CANONICAL.get(w, w) for w in _WORD_RE.findall(text) if w not in _STOPWORDS)
+
+
+@lru_cache(maxsize=65536)
+def _word_hashes(word):
+    h = zlib.crc32(word.encode()) & _MASK
+    return tuple((a * h + b) % _MERSENNE for a, b in _PERMUTATIONS)
+
+
+def signature(words):
+    """MinHash signature of a non-empty word set."""
+    return tuple(map(min, zip(*map(_word_hashes, words))))
+
+
+def numbers(title):
+    """Numbers in a headline, with thousands separators dropped ("22,000" == "22000")."""
+    return frozenset(n.replace(",", "") for n in _NUMBER_RE.findall(title))
+
+
+def directions(title):
+    """Which of "up"/"down" a headline's verbs and prepositions point."""
+    return frozenset(_DIRECTION_OF[w] for w in _WORD_RE.findall(title.lower()) if w in _DIRECTION_OF)
+
+
+def jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def canonical_url(url):
+    """Scheme, "www.", query, fragment and trailing slash stripped; lowercased."""
+    return re.sub(r"^https?://(www\.)?", "", (url or "").split("?")[0].split("#")[0]).rstrip("/").lower()
+
+
+def _find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def cluster(articles, threshold=None):
+    """
+    Groups articles that report the same story: same URL, or headlines
+    whose content-word Jaccard similarity is at least `threshold` and that
+    carry the same numbers and point the same direction (rises/falls).
+    Candidates come from MinHash/LSH buckets, so only headlines that share
+    a bucket are compared and the whole pass stays roughly linear.
+    Returns lists of indexes into `articles`, each in input order, ordered
+    by their first member.
+    """
+    threshold = THRESHOLD if threshold is None else threshold
+    titles = [article.get("title") or "" for article in articles]
+    words = [folded_tokens(title) for title in titles]
+    guards = [(numbers(title), directions(title)) for title in titles]
+    parent = list(range(len(articles)))
+    buckets = {}
+
+    def union(i, j):
+        ri, rj = _find(parent, i), _find(parent, j)
+        if ri != rj:
+            parent[max(ri, rj)] = min(ri, rj)
+
+    for i, article in enumerate(articles):
+        keys = []
+        url = canonical_url(article.get("url"))
+        if url:
+            keys.append(("url", url))
+        if words[i]:
+            sig = signature(words[i])
+            keys.extend((band, sig[band:band + ROWS]) for band in range(0, NUM_HASHES, ROWS))
+        compared = set()
+        for key in keys:
+            members = buckets.setdefault(key, [])
+            for j in members:
+                if j in compared:
+                    continue
+                compared.add(j)
+                if key[0] == "url" or (guards[i] == guards[j] and jaccard(words[i], words[j]) >= threshold):
+                    union(i, j)
+            members.append(i)
+
+    groups = {}
+    for i in range(len(articles)):
+        groups.setdefault(_find(parent, i), []).append(i)
+    return sorted(groups.values(), key=lambda group: group[0])
+
+
+def collapse(articles, threshold=None):
+    """
+    One article per story. The first article of each cluster (sources are
+    listed in preference order) is kept; the others are recorded on it as
+    `also_reported_by` entries of {"source", "title", "url"}.
+    """
+    collapsed = []
+    for group in cluster(articles, threshold):
+        representative = dict(articles[group[0]])
+        if len(group) > 1:
+            representative["also_reported_by"] = [
+                {key: articles[i].get(key) for key in ("source", "title", "url")} for i in group[1:]
+            ]
+        collapsed.append(representative)
+    if len(collapsed) < len(articles):
+        print(f"[near_duplicates] Collapsed {len(articles)} articles into {len(collapsed)} stories.")
+    return collapsed
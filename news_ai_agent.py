@@ -1,6 +1,4 @@
 import os
-from langchain_core.messages import HumanMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
 from emailer import send_email, build_html_email
 from higher_ed import scrape_higher_ed_news
 from entertainment import scrape_entertainment_news
@@ -13,62 +11,40 @@ from environment import scrape_environment_news
 from industry import scrape_industry_news
 from health import scrape_health_news
 from urllib.parse import urlparse
+import near_duplicates
+import sent_store
+import score_cache
+import ranking_service
 import re
 
 load_dotenv(dotenv_path="scratch.env")
-GEMINI_API_KEY = os.getenv("GOOGLE_API_KEY")
+# Seconds the whole scraping stage of a digest may take; sources still
+# running after that are cancelled and the digest goes out with the rest.
+SCRAPE_DEADLINE = float(os.getenv("NEWS_SCRAPE_DEADLINE", "8"))
 
-def select_top_news_with_gemini(articles, top_n=10, return_scores=False):
+def select_top_news_with_gemini(articles, top_n=10, return_scores=False, category=None):
     print(f"[Gemini] Preparing to call Gemini LLM with {len(articles)} articles, requesting top {top_n}.")
-    if not GEMINI_API_KEY:
+    ranker = ranking_service.get()
+    if not ranker.available():
         print("Gemini API key not found.")
         return articles[:top_n] if not return_scores else [(art, None) for art in articles[:top_n]]
 
-    llm = ChatGoogleGenerativeAI(
-        model="models/gemini-1.5-flash", google_api_key=GEMINI_API_KEY
-    )
-
-    prompt = (
-        "You are an expert news assistant. "
-        "Given the following list of news headlines (with their sources and links), "
-        "for each headline, assign an importance score from 1 (least important) to 10 (most important) for inclusion in an education news digest. "
-        "Consider newsworthiness, impact, and diversity. "
-        "Return your answer as a numbered list in this format:\n"
-        "<SOURCE>, <HEADLINE>\n<LINK>\nScore: <score>\n\n"
-        "Here is the list:\n"
-    )
-
-    for idx, article in enumerate(articles, 1):
-        source = article.get("source", "Unknown Source")
-        title = article["title"]
-        url = article["url"]
-        prompt += f"{idx}. {source}, {title}\n{url}\n"
-
-    print("[Gemini] Calling Gemini LLM API...")
-    response = llm.invoke([HumanMessage(content=prompt)])
-    print("[Gemini] Gemini LLM API call completed.")
-    print("Gemini raw output:\n", response.content)
-
-    lines = str(response.content).split("\n")
-    scored_articles = []
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        if line and "," in line and line[0].isdigit() and "." in line:
-            source_headline = line.split(".", 1)[1].strip()
-            url = lines[i + 1].strip() if i + 1 < len(lines) else ""
-            score_line = lines[i + 2].strip() if i + 2 < len(lines) else ""
-            score_match = re.search(r"Score:\s*(\d+)", score_line)
-            score = int(score_match.group(1)) if score_match else 0
-            for art in articles:
-                if art["title"] in source_headline and art["url"] in url:
-                    scored_articles.append((art, score))
-                    break
-            i += 3
-        else:
-            i += 1
-
-    scored_articles.sort(key=lambda x: x[1], reverse=True)
+    # Headlines scored recently (for this or another digest) skip the LLM.
+    scored_articles, unscored = score_cache.lookup(ranker.cache_version, category, articles)
+    print(f"[Gemini] {len(scored_articles)} scores cached, {len(unscored)} articles to score.")
+    if unscored:
+        try:
+            new_scores = ranker.score(unscored)
+        except Exception as e:
+            print(f"[Gemini] Ranking failed, sending unranked: {e}")
+            return articles[:top_n] if not return_scores else [(art, None) for art in articles[:top_n]]
+        # Skipped articles get another chance at a real score next time.
+        score_cache.store(ranker.cache_version, category,
+                          [(art, score) for art, score in new_scores if score != ranking_service.UNSCORED])
+        scored_articles += new_scores
+
+    order = {id(art): i for i, art in enumerate(articles)}
+    scored_articles.sort(key=lambda x: (-x[1], order[id(x[0])]))
     return scored_articles[:top_n] if return_scores else [art for art, score in scored_articles[:top_n]]
 
 def create_display_url(url, max_length=50):
@@ -108,7 +84,7 @@ def format_email(articles):
 
     return body
 
-def process_and_send(emails, category, region, top_n=10, sources=None):
+def process_and_send(emails, category, region, top_n=10, sources=None, deadline=SCRAPE_DEADLINE):
     print(f"[process_and_send] Function Called with category={category}, region={region}, top_n={top_n}, sources={sources}")
     errors = []
     articles = []
@@ -116,34 +92,36 @@ def process_and_send(emails, category, region, top_n=10, sources=None):
 
     # Scraping
     if category == "higher_ed":
-        articles = scrape_higher_ed_news(region=region, sources=sources)
+        articles = scrape_higher_ed_news(region=region, sources=sources, deadline=deadline, errors=errors)
         topic = f"{region} Higher Education"
     elif category == "entertainment":
-        articles = scrape_entertainment_news(region=region, sources=sources)
+        articles = scrape_entertainment_news(region=region, sources=sources, deadline=deadline, errors=errors)
         topic = f"{region} Entertainment"
     elif category == "sports":
-        articles = scrape_sports_news(region=region, sources=sources)
+        articles = scrape_sports_news(region=region, sources=sources, deadline=deadline, errors=errors)
         topic = f"{region} Sports"
     elif category == "business_and_finance":
-        articles = scrape_business_finance_news(region=region, sources=sources)
+        articles = scrape_business_finance_news(region=region, sources=sources, deadline=deadline, errors=errors)
         topic = f"{region} Business & Finance"
     elif category == "tech":
-        articles = scrape_technology_news(region=region, sources=sources)
+        articles = scrape_technology_news(region=region, sources=sources, deadline=deadline, errors=errors)
         topic = f"{region} Technology"
     elif category == "environment":
-        articles = scrape_environment_news(region=region, sources=sources)
+        articles = scrape_environment_news(region=region, sources=sources, deadline=deadline, errors=errors)
         topic = f"{region} Environment"
     elif category == "industry":
-        articles = scrape_industry_news(region=region, sources=sources)
+        articles = scrape_industry_news(region=region, sources=sources, deadline=deadline, errors=errors)
         topic = f"{region} Industry"
     elif category == "health":
-        articles = scrape_health_news(region=region, sources=sources)
+        articles = scrape_health_news(region=region, sources=sources, deadline=deadline, errors=errors)
         topic = f"{region} Health"
     else:
-        articles, errors = scrape_news(region, sources)
+        articles, errors = scrape_news(region, sources, deadline=deadline)
         topic = region if region else "General"
 
     print(f"[process_and_send] Scraping complete. Found {len(articles)} articles.")
+    # The same story from several outlets is ranked (and paid for) once.
+    articles = near_duplicates.collapse(articles)
 
     if not emails:
         return "\u274c Please enter at least one email address"
@@ -159,8 +137,12 @@ def process_and_send(emails, category, region, top_n=10, sources=None):
             msg += "\n\n\u26a0\ufe0f Some sources failed to scrape:\n" + "\n".join(errors)
         return msg
 
+    articles = sent_store.filter_unsent(email_list, articles)
+    if not articles:
+        return "\u2139\ufe0f No new articles since your last digest. Please try again later."
+
     print(f"Calling select_top_news_with_gemini with {len(articles)} articles.")
-    top_articles = select_top_news_with_gemini(articles, top_n=top_n)
+    top_articles = select_top_news_with_gemini(articles, top_n=top_n, category=category)
     print(f"Gemini selection complete. {len(top_articles)} articles selected.")
 
     email_body = format_email(top_articles)
@@ -173,6 +155,7 @@ def process_and_send(emails, category, region, top_n=10, sources=None):
             success.append(email)
         else:
             failed.append(email)
+    sent_store.record_sent(success, top_articles)
 
     msg = ""
     if success:
@@ -1,35 +1,52 @@
 # news_sources.py
-import requests
-from bs4 import BeautifulSoup
-import time
+from parse_cache import parse_articles
 import re
+import http_client
+from functools import partial
+from source_registry import register
+from source_runner import run_sources_async, run_sync, source_tasks, DEFAULT_MAX_WORKERS, DEFAULT_DEADLINE
+from title_normalizer import clean_title
 
 
 def get_session():
-    session = requests.Session()
-    session.headers.update({
+    return http_client.get_session({
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         'Accept-Language': 'en-US,en;q=0.5',
         'Accept-Encoding': 'gzip, deflate',
         'Connection': 'keep-alive',
     })
-    return session
 
 
-def clean_title(title):
-    if not title:
-        return None
-    title = re.sub(r'\s+', ' ', title.strip())
-    if len(title) < 10 or len(title) > 200:
-        return None
-    # Filter out navigation items and ads
-    skip_words = ['subscribe', 'login', 'register', 'advertisement', 'menu', 'search', 'newsletter']
-    if any(word in title.lower() for word in skip_words):
-        return None
-    return title
+# Sources that are a plain headline-link list are declared, not hand-written.
+_source = partial(register, __name__, clean=clean_title, session=get_session)
 
+# Hand-written: each layout finds its link and title differently, falling back to the link text.
+def _extract_flipboard(soup):
+    articles = []
+
+    # Try multiple selectors for Flipboard's evolving structure
+    for item in soup.select('a[href*="/story/"], a.article-link, div.article, article.story'):
+        link = item if item.name == 'a' else item.find('a', href=True)
+        if not link:
+            continue
+
+        title_tag = link.find('h2') or link.find('div', class_='title') or link
+        title = clean_title(title_tag.get_text())
+        if not title:
+            continue
+
+        href = link['href']
+        if not href.startswith('http'):
+            href = "https://flipboard.com" + href
+
+        articles.append({
+            "title": title,
+            "url": href,
+            "source": "Flipboard"
+        })
 
+    return articles
 
 def scrape_flipboard(region="India"):
     try:
@@ -47,35 +64,39 @@ def scrape_flipboard(region="India"):
             url = "https://flipboard.com/topic/education"
 
         response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-
-        # Try multiple selectors for Flipboard's evolving structure
-        for item in soup.select('a[href*="/story/"], a.article-link, div.article, article.story'):
-            link = item if item.name == 'a' else item.find('a', href=True)
-            if not link:
-                continue
-
-            title_tag = link.find('h2') or link.find('div', class_='title') or link
-            title = clean_title(title_tag.get_text())
-            if not title:
-                continue
-
-            href = link['href']
-            if not href.startswith('http'):
-                href = "https://flipboard.com" + href
-
-            articles.append({
-                "title": title,
-                "url": href,
-                "source": "Flipboard"
-            })
-
-        return articles
+        return parse_articles(response, _extract_flipboard, "Flipboard")
     except Exception as e:
         print(f"Error scraping Flipboard: {e}")
         return []
 
+# Hand-written: the title and the link are found separately inside each post.
+def _extract_scoopit(soup):
+    articles = []
+    # More robust selector
+    for item in soup.select('[class*="postItem"]'):
+        title_tag = item.find('h2') or item.find('h3') or item.find(class_='title')
+        if not title_tag:
+            continue
+
+        title = clean_title(title_tag.get_text())
+        if not title:
+            continue
+
+        link = item.find('a', href=True)
+        if not link:
+            continue
+
+        href = link['href']
+        if href.startswith('/'):
+            href = "https://www.scoop.it" + href
+
+        articles.append({
+            "title": title,
+            "url": href,
+            "source": "Scoop.it"
+        })
+    return articles
+
 def scrape_scoopit(region="India"):
     try:
         session = get_session()
@@ -95,631 +116,232 @@ def scrape_scoopit(region="India"):
         for topic in topics:
             url = f"https://www.scoop.it/topic/{topic}"
             response = session.get(url, timeout=15)
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            # More robust selector
-            for item in soup.select('[class*="postItem"]'):
-                title_tag = item.find('h2') or item.find('h3') or item.find(class_='title')
-                if not title_tag:
-                    continue
-
-                title = clean_title(title_tag.get_text())
-                if not title:
-                    continue
-
-                link = item.find('a', href=True)
-                if not link:
-                    continue
-
-                href = link['href']
-                if href.startswith('/'):
-                    href = "https://www.scoop.it" + href
-
-                articles.append({
-                    "title": title,
-                    "url": href,
-                    "source": "Scoop.it"
-                })
+            articles.extend(parse_articles(response, _extract_scoopit, "Scoop.it"))
 
         return articles[:15]
     except Exception as e:
         print(f"Error scraping Scoop.it: {e}")
         return []
         #Indian News Sources
-def scrape_hindustan_times():
-    try:
-        session = get_session()
-        url = "https://www.hindustantimes.com/education"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-
-        selectors = ['h3 a', 'h2 a', '.story-box a', '.listView a', '.story-title a']
-
-        seen_titles = set()
-        for selector in selectors:
-            for tag in soup.select(selector):
-                title = clean_title(tag.get_text())
-                href = tag.get('href', '')
-
-                if title and title not in seen_titles and href:
-                    if href.startswith('/'):
-                        href = "https://www.hindustantimes.com" + href
-                    elif not href.startswith('http'):
-                        continue
-
-                    articles.append({"title": title, "url": href, "source": "Hindustan Times"})
-                    seen_titles.add(title)
-
-        return articles
-    except Exception as e:
-        print(f"Error scraping Hindustan Times: {e}")
-        return []
+scrape_hindustan_times = _source(
+    "scrape_hindustan_times",
+    "Hindustan Times",
+    "https://www.hindustantimes.com/education",
+    selectors=['h3 a', 'h2 a', '.story-box a', '.listView a', '.story-title a'],
+    base_url="https://www.hindustantimes.com",
+)
 
 # ...existing code...
 
-def scrape_times_of_india():
-    try:
-        session = get_session()
-        url = "https://timesofindia.indiatimes.com/topic/education"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-
-        selectors = ['span.w_tle a', '.story-list a', '.list5 a']
-
-        seen_titles = set()
-        for selector in selectors:
-            for tag in soup.select(selector):
-                title = clean_title(tag.get_text())
-                href = tag.get('href', '')
-
-                if title and title not in seen_titles and href:
-                    if href.startswith('/'):
-                        href = "https://timesofindia.indiatimes.com" + href
-                    elif not href.startswith('http'):
-                        continue
-
-                    articles.append({"title": title, "url": href, "source": "Times of India"})
-                    seen_titles.add(title)
-
-        return articles
-    except Exception as e:
-        print(f"Error scraping Times of India: {e}")
-        return []
-
-def scrape_indian_express_education():
-    try:
-        session = get_session()
-        url = "https://indianexpress.com/section/education/"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-
-        selectors = ['.title a', 'h2 a', '.articles a', '.entry-title a']
-
-        seen_titles = set()
-        for selector in selectors:
-            for tag in soup.select(selector):
-                title = clean_title(tag.get_text())
-                href = tag.get('href', '')
-
-                if title and title not in seen_titles and href:
-                    if href.startswith('/'):
-                        href = "https://indianexpress.com" + href
-                    elif not href.startswith('http'):
-                        continue
-
-                    articles.append({"title": title, "url": href, "source": "Indian Express"})
-                    seen_titles.add(title)
-
-        return articles
-    except Exception as e:
-        print(f"Error scraping Indian Express: {e}")
-        return []
-
-def scrape_the_hindu_education():
-    try:
-        session = get_session()
-        url = "https://www.thehindu.com/education/"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-
-        selectors = ['.title a', 'h2 a', 'h3 a', '.story-card-news a']
-
-        seen_titles = set()
-        for selector in selectors:
-            for tag in soup.select(selector):
-                title = clean_title(tag.get_text())
-                href = tag.get('href', '')
-
-                if title and title not in seen_titles and href:
-                    if href.startswith('/'):
-                        href = "https://www.thehindu.com" + href
-                    elif not href.startswith('http'):
-                        continue
-
-                    articles.append({"title": title, "url": href, "source": "The Hindu"})
-                    seen_titles.add(title)
-
-        return articles
-    except Exception as e:
-        print(f"Error scraping The Hindu: {e}")
-        return []
-
-def scrape_deccan_herald_education():
-    try:
-        session = get_session()
-        url = "https://www.deccanherald.com/education"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-
-        selectors = ['.article-title a', 'h2 a', 'h3 a', '.story-title a']
-
-        seen_titles = set()
-        for selector in selectors:
-            for tag in soup.select(selector):
-                title = clean_title(tag.get_text())
-                href = tag.get('href', '')
-
-                if title and title not in seen_titles and href:
-                    if href.startswith('/'):
-                        href = "https://www.deccanherald.com" + href
-                    elif not href.startswith('http'):
-                        continue
-
-                    articles.append({"title": title, "url": href, "source": "Deccan Herald"})
-                    seen_titles.add(title)
-
-        return articles
-    except Exception as e:
-        print(f"Error scraping Deccan Herald: {e}")
-        return []
-
-def scrape_ndtv_education():
-    try:
-        session = get_session()
-        url = "https://www.ndtv.com/education"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-
-        selectors = ['.newsHdng a', 'h2 a', 'h1 a', '.news-title a']
-
-        seen_titles = set()
-        for selector in selectors:
-            for tag in soup.select(selector):
-                title = clean_title(tag.get_text())
-                href = tag.get('href', '')
-
-                if title and title not in seen_titles and href:
-                    if href.startswith('/'):
-                        href = "https://www.ndtv.com" + href
-                    elif not href.startswith('http'):
-                        continue
-
-                    articles.append({"title": title, "url": href, "source": "NDTV"})
-                    seen_titles.add(title)
-
-        return articles
-    except Exception as e:
-        print(f"Error scraping NDTV: {e}")
-        return []
-
-def scrape_financial_express_education():
-    try:
-        session = get_session()
-        url = "https://www.financialexpress.com/education/"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-
-        selectors = ['.listitembx h3 a', 'h2 a', '.title a']
-
-        seen_titles = set()
-        for selector in selectors:
-            for tag in soup.select(selector):
-                title = clean_title(tag.get_text())
-                href = tag.get('href', '')
-
-                if title and title not in seen_titles and href:
-                    if href.startswith('/'):
-                        href = "https://www.financialexpress.com" + href
-                    elif not href.startswith('http'):
-                        continue
-
-                    articles.append({"title": title, "url": href, "source": "Financial Express"})
-                    seen_titles.add(title)
-
-        return articles
-    except Exception as e:
-        print(f"Error scraping Financial Express: {e}")
-        return []
-
-def scrape_bbc_education():
-    try:
-        session = get_session()
-        url = "https://www.bbc.com/news/education"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-
-        selectors = ['h3 a', 'h2 a', '.gel-layout__item a', '.media__content a']
-
-        seen_titles = set()
-        for selector in selectors:
-            for tag in soup.select(selector):
-                title = clean_title(tag.get_text())
-                href = tag.get('href', '')
-
-                if title and title not in seen_titles and href:
-                    if href.startswith('/'):
-                        href = "https://www.bbc.com" + href
-                    elif not href.startswith('http'):
-                        continue
-
-                    articles.append({"title": title, "url": href, "source": "BBC"})
-                    seen_titles.add(title)
-
-        return articles
-    except Exception as e:
-        print(f"Error scraping BBC: {e}")
-        return []
-
-def scrape_guardian_education():
-    try:
-        session = get_session()
-        url = "https://www.theguardian.com/education"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-
-        selectors = ['.fc-item__title a', '.u-faux-block-link__overlay', 'h3 a']
-
-        seen_titles = set()
-        for selector in selectors:
-            for tag in soup.select(selector):
-                title = clean_title(tag.get_text())
-                href = tag.get('href', '')
-
-                if title and title not in seen_titles and href:
-                    if href.startswith('/'):
-                        href = "https://www.theguardian.com" + href
-                    elif not href.startswith('http'):
-                        continue
-
-                    articles.append({"title": title, "url": href, "source": "The Guardian"})
-                    seen_titles.add(title)
-
-        return articles
-    except Exception as e:
-        print(f"Error scraping Guardian: {e}")
-        return []
-
-def scrape_nytimes_education():
-    try:
-        session = get_session()
-        url = "https://www.nytimes.com/section/education"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-
-        selectors = ['h3 a', 'h2 a', '.css-1l4spti a']
-
-        seen_titles = set()
-        for selector in selectors:
-            for tag in soup.select(selector):
-                title = clean_title(tag.get_text())
-                href = tag.get('href', '')
-
-                if title and title not in seen_titles and href:
-                    if href.startswith('/'):
-                        href = "https://www.nytimes.com" + href
-                    elif not href.startswith('http'):
-                        continue
-
-                    articles.append({"title": title, "url": href, "source": "NY Times"})
-                    seen_titles.add(title)
-
-        return articles
-    except Exception as e:
-        print(f"Error scraping NY Times: {e}")
-        return []
-
-def scrape_washington_post_education():
-    try:
-        session = get_session()
-        url = "https://www.washingtonpost.com/education/"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-
-        selectors = ['h3 a', 'h2 a', '.headline a', '.title a']
-
-        seen_titles = set()
-        for selector in selectors:
-            for tag in soup.select(selector):
-                title = clean_title(tag.get_text())
-                href = tag.get('href', '')
-
-                if title and title not in seen_titles and href:
-                    if href.startswith('/'):
-                        href = "https://www.washingtonpost.com" + href
-                    elif not href.startswith('http'):
-                        continue
-
-                    articles.append({"title": title, "url": href, "source": "Washington Post"})
-                    seen_titles.add(title)
-
-        return articles
-    except Exception as e:
-        print(f"Error scraping Washington Post: {e}")
-        return []
-
-def scrape_telegraph_education():
-    try:
-        session = get_session()
-        url = "https://www.telegraph.co.uk/education/"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-
-        selectors = ['h3 a', 'h2 a', '.list-headline a', '.card__heading a']
-
-        seen_titles = set()
-        for selector in selectors:
-            for tag in soup.select(selector):
-                title = clean_title(tag.get_text())
-                href = tag.get('href', '')
-
-                if title and title not in seen_titles and href:
-                    if href.startswith('/'):
-                        href = "https://www.telegraph.co.uk" + href
-                    elif not href.startswith('http'):
-                        continue
-
-                    articles.append({"title": title, "url": href, "source": "The Telegraph"})
-                    seen_titles.add(title)
-
-        return articles
-    except Exception as e:
-        print(f"Error scraping Telegraph: {e}")
-        return []
-
-def scrape_times_higher_education():
-    try:
-        session = get_session()
-        url = "https://www.timeshighereducation.com/news"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-
-        selectors = ['h3 a', 'h2 a', '.views-field-title a', '.article-title a']
-
-        seen_titles = set()
-        for selector in selectors:
-            for tag in soup.select(selector):
-                title = clean_title(tag.get_text())
-                href = tag.get('href', '')
-
-                if title and title not in seen_titles and href:
-                    if href.startswith('/'):
-                        href = "https://www.timeshighereducation.com" + href
-                    elif not href.startswith('http'):
-                        continue
-
-                    articles.append({"title": title, "url": href, "source": "Times Higher Education"})
-                    seen_titles.add(title)
-
-        return articles
-    except Exception as e:
-        print(f"Error scraping Times Higher Education: {e}")
-        return []
-
-def scrape_inside_higher_ed():
-    try:
-        session = get_session()
-        url = "https://www.insidehighered.com/news"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-
-        selectors = ['h3 a', 'h2 a', '.views-field-title a', '.article-title a']
-
-        seen_titles = set()
-        for selector in selectors:
-            for tag in soup.select(selector):
-                title = clean_title(tag.get_text())
-                href = tag.get('href', '')
-
-                if title and title not in seen_titles and href:
-                    if href.startswith('/'):
-                        href = "https://www.insidehighered.com" + href
-                    elif not href.startswith('http'):
-                        continue
-
-                    articles.append({"title": title, "url": href, "source": "Inside Higher Ed"})
-                    seen_titles.add(title)
-
-        return articles
-    except Exception as e:
-        print(f"Error scraping Inside Higher Ed: {e}")
-        return []
-
-def scrape_edweek():
-    try:
-        session = get_session()
-        url = "https://www.edweek.org/"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-
-        selectors = ['h3 a', 'h2 a', '.article-title a', '.headline a']
-
-        seen_titles = set()
-        for selector in selectors:
-            for tag in soup.select(selector):
-                title = clean_title(tag.get_text())
-                href = tag.get('href', '')
-
-                if title and title not in seen_titles and href:
-                    if href.startswith('/'):
-                        href = "https://www.edweek.org" + href
-                    elif not href.startswith('http'):
-                        continue
-
-                    articles.append({"title": title, "url": href, "source": "EdWeek"})
-                    seen_titles.add(title)
-
-        return articles
-    except Exception as e:
-        print(f"Error scraping EdWeek: {e}")
-        return []
-
-def scrape_chronicle():
-    try:
-        session = get_session()
-        url = "https://www.chronicle.com/"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-
-        selectors = ['h3 a', 'h2 a', '.hed a', '.title a']
+scrape_times_of_india = _source(
+    "scrape_times_of_india",
+    "Times of India",
+    "https://timesofindia.indiatimes.com/topic/education",
+    selectors=['span.w_tle a', '.story-list a', '.list5 a'],
+    base_url="https://timesofindia.indiatimes.com",
+)
+
+scrape_indian_express_education = _source(
+    "scrape_indian_express_education",
+    "Indian Express",
+    "https://indianexpress.com/section/education/",
+    selectors=['.title a', 'h2 a', '.articles a', '.entry-title a'],
+    base_url="https://indianexpress.com",
+)
+
+scrape_the_hindu_education = _source(
+    "scrape_the_hindu_education",
+    "The Hindu",
+    "https://www.thehindu.com/education/",
+    selectors=['.title a', 'h2 a', 'h3 a', '.story-card-news a'],
+    base_url="https://www.thehindu.com",
+)
+
+scrape_deccan_herald_education = _source(
+    "scrape_deccan_herald_education",
+    "Deccan Herald",
+    "https://www.deccanherald.com/education",
+    selectors=['.article-title a', 'h2 a', 'h3 a', '.story-title a'],
+    base_url="https://www.deccanherald.com",
+)
+
+scrape_ndtv_education = _source(
+    "scrape_ndtv_education",
+    "NDTV",
+    "https://www.ndtv.com/education",
+    selectors=['.newsHdng a', 'h2 a', 'h1 a', '.news-title a'],
+    base_url="https://www.ndtv.com",
+)
+
+scrape_financial_express_education = _source(
+    "scrape_financial_express_education",
+    "Financial Express",
+    "https://www.financialexpress.com/education/",
+    selectors=['.listitembx h3 a', 'h2 a', '.title a'],
+    base_url="https://www.financialexpress.com",
+)
+
+scrape_bbc_education = _source(
+    "scrape_bbc_education",
+    "BBC",
+    "https://www.bbc.com/news/education",
+    selectors=['h3 a', 'h2 a', '.gel-layout__item a', '.media__content a'],
+    base_url="https://www.bbc.com",
+)
+
+scrape_guardian_education = _source(
+    "scrape_guardian_education",
+    "The Guardian",
+    "https://www.theguardian.com/education",
+    selectors=['.fc-item__title a', '.u-faux-block-link__overlay', 'h3 a'],
+    base_url="https://www.theguardian.com",
+    error_name="Guardian",
+)
+
+scrape_nytimes_education = _source(
+    "scrape_nytimes_education",
+    "NY Times",
+    "https://www.nytimes.com/section/education",
+    selectors=['h3 a', 'h2 a', '.css-1l4spti a'],
+    base_url="https://www.nytimes.com",
+)
+
+scrape_washington_post_education = _source(
+    "scrape_washington_post_education",
+    "Washington Post",
+    "https://www.washingtonpost.com/education/",
+    selectors=['h3 a', 'h2 a', '.headline a', '.title a'],
+    base_url="https://www.washingtonpost.com",
+)
+
+scrape_telegraph_education = _source(
+    "scrape_telegraph_education",
+    "The Telegraph",
+    "https://www.telegraph.co.uk/education/",
+    selectors=['h3 a', 'h2 a', '.list-headline a', '.card__heading a'],
+    base_url="https://www.telegraph.co.uk",
+    error_name="Telegraph",
+)
+
+scrape_times_higher_education = _source(
+    "scrape_times_higher_education",
+    "Times Higher Education",
+    "https://www.timeshighereducation.com/news",
+    selectors=['h3 a', 'h2 a', '.views-field-title a', '.article-title a'],
+    base_url="https://www.timeshighereducation.com",
+)
+
+scrape_inside_higher_ed = _source(
+    "scrape_inside_higher_ed",
+    "Inside Higher Ed",
+    "https://www.insidehighered.com/news",
+    selectors=['h3 a', 'h2 a', '.views-field-title a', '.article-title a'],
+    base_url="https://www.insidehighered.com",
+)
+
+scrape_edweek = _source(
+    "scrape_edweek",
+    "EdWeek",
+    "https://www.edweek.org/",
+    selectors=['h3 a', 'h2 a', '.article-title a', '.headline a'],
+    base_url="https://www.edweek.org",
+)
+
+scrape_chronicle = _source(
+    "scrape_chronicle",
+    "The Chronicle",
+    "https://www.chronicle.com/",
+    selectors=['h3 a', 'h2 a', '.hed a', '.title a'],
+    base_url="https://www.chronicle.com",
+    error_name="Chronicle",
+)
+
+# Hand-written: titles are kept as given, without clean_title's length and skip-word filter.
+def _extract_india_today_education(soup):
+    articles = []
 
-        seen_titles = set()
-        for selector in selectors:
-            for tag in soup.select(selector):
-                title = clean_title(tag.get_text())
-                href = tag.get('href', '')
+    # Each article is inside a div with class 'B1S3_content__wrap__9mSB6'
+    for item in soup.select('div.B1S3_content__wrap__9mSB6'):
+        a_tag = item.find('a', href=True, title=True)
+        if not a_tag:
+            continue
+        title = a_tag['title'].strip()
+        href = a_tag['href']
+        if href.startswith('/'):
+            href = "https://www.indiatoday.in" + href
 
-                if title and title not in seen_titles and href:
-                    if href.startswith('/'):
-                        href = "https://www.chronicle.com" + href
-                    elif not href.startswith('http'):
-                        continue
-
-                    articles.append({"title": title, "url": href, "source": "The Chronicle"})
-                    seen_titles.add(title)
-
-        return articles
-    except Exception as e:
-        print(f"Error scraping Chronicle: {e}")
-        return []
+        articles.append({"title": title, "url": href, "source": "India Today" })
 
+    return articles
 
 def scrape_india_today_education():
     try:
         session = get_session()
         url = "https://www.indiatoday.in/education-today/news"
         response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-
-        # Each article is inside a div with class 'B1S3_content__wrap__9mSB6'
-        for item in soup.select('div.B1S3_content__wrap__9mSB6'):
-            a_tag = item.find('a', href=True, title=True)
-            if not a_tag:
-                continue
-            title = a_tag['title'].strip()
-            href = a_tag['href']
-            if href.startswith('/'):
-                href = "https://www.indiatoday.in" + href
-
-            articles.append({"title": title, "url": href, "source": "India Today" })
-
-        return articles
+        return parse_articles(response, _extract_india_today_education, "India Today")
     except Exception as e:
         print(f"Error scraping India Today: {e}")
         return []
 
-def scrape_news(region, sources=None):
-    articles = []
-    
-    errors = []
+def _news_tasks(region, sources):
+    source_map = {
+        # "google_news": scrape_google_news,  # REMOVED
+        "flipboard": lambda: scrape_flipboard(region),
+        "scoopit": lambda: scrape_scoopit(region),
+        "hindustan_times": scrape_hindustan_times,
+        "times_of_india": scrape_times_of_india,
+        "indian_express": scrape_indian_express_education,
+        "the_hindu": scrape_the_hindu_education,
+        "deccan_herald": scrape_deccan_herald_education,
+        "ndtv": scrape_ndtv_education,
+        "financial_express": scrape_financial_express_education,
+        "india_today": scrape_india_today_education,  # <-- Added India Today here
+        "bbc": scrape_bbc_education,
+        "guardian": scrape_guardian_education,
+        "nytimes": scrape_nytimes_education,
+        "washington_post": scrape_washington_post_education,
+        "telegraph": scrape_telegraph_education,
+        "times_higher_education": scrape_times_higher_education,
+        "inside_higher_ed": scrape_inside_higher_ed,
+        "edweek": scrape_edweek,
+        "chronicle": scrape_chronicle,
+    }
     if not sources:
         print(f"Scraping news for region: {region}")
 
-        # Primary sources (scrape more from these)
-        flipboard = scrape_flipboard(region)
-        print(f"Flipboard articles: {len(flipboard)}")
-        articles.extend(flipboard)
-        time.sleep(2)
-
-        scoopit = scrape_scoopit(region)
-        print(f"Scoop.it articles: {len(scoopit)}")
-        articles.extend(scoopit)
-        time.sleep(2)
-
-        # Secondary sources (scrape fewer from these)
+        # Primary sources (scrape more from these), then secondary sources
+        # (scrape fewer from these).
+        sources = ["flipboard", "scoopit"]
         if region == "India":
-            default_sources = [
-                scrape_hindustan_times,
-                scrape_times_of_india,
-                scrape_indian_express_education,
-                scrape_the_hindu_education,
-                scrape_deccan_herald_education,
-                scrape_ndtv_education,
-                scrape_financial_express_education,
-                scrape_india_today_education  # <-- Added India Today here
+            sources += [
+                "hindustan_times",
+                "times_of_india",
+                "indian_express",
+                "the_hindu",
+                "deccan_herald",
+                "ndtv",
+                "financial_express",
+                "india_today",
             ]
         else:
-            default_sources = [
-                scrape_bbc_education,
-                scrape_guardian_education,
-                scrape_nytimes_education,
-                scrape_washington_post_education,
-                scrape_telegraph_education,
-                scrape_times_higher_education,
-                scrape_inside_higher_ed,
-                scrape_edweek,
-                scrape_chronicle
+            sources += [
+                "bbc",
+                "guardian",
+                "nytimes",
+                "washington_post",
+                "telegraph",
+                "times_higher_education",
+                "inside_higher_ed",
+                "edweek",
+                "chronicle",
             ]
 
-        for source in default_sources:
-            try:
-                source_articles = source()
-                articles.extend(source_articles)
-                time.sleep(2)
-            except Exception as e:
-                error_msg = f"Error scraping {source.__name__}: {e}"
-                print(error_msg)
-                errors.append(error_msg)
-    else:
-        source_map = {
-            # "google_news": scrape_google_news,  # REMOVED
-            "flipboard": lambda: scrape_flipboard(region),
-            "scoopit": lambda: scrape_scoopit(region),
-            "hindustan_times": scrape_hindustan_times,
-            "times_of_india": scrape_times_of_india,
-            "indian_express": scrape_indian_express_education,
-            "the_hindu": scrape_the_hindu_education,
-            "deccan_herald": scrape_deccan_herald_education,
-            "ndtv": scrape_ndtv_education,
-            "financial_express": scrape_financial_express_education,
-            "india_today": scrape_india_today_education,  # <-- Added India Today here
-            "bbc": scrape_bbc_education,
-            "guardian": scrape_guardian_education,
-            "nytimes": scrape_nytimes_education,
-            "washington_post": scrape_washington_post_education,
-            "telegraph": scrape_telegraph_education,
-            "times_higher_education": scrape_times_higher_education,
-            "inside_higher_ed": scrape_inside_higher_ed,
-            "edweek": scrape_edweek,
-            "chronicle": scrape_chronicle,
-       }
-        for src in sources:
-            func = source_map.get(src)
-            if func:
-                try:
-                    articles.extend(func())
-                except Exception as e:
-                    error_msg = f"Error scraping {src}: {e}"
-                    print(error_msg)
-                    errors.append(error_msg)
-
+    # Keyed by the source_map name whichever way the sources were picked, so
+    # a source shares one cache entry, flight and circuit across requests.
+    return source_tasks("general", source_map, region, sources)
 
+def _dedupe(articles):
     # Enhanced duplicate removal
     seen_urls = set()
     seen_titles = set()
@@ -738,4 +360,25 @@ def scrape_news(region, sources=None):
             seen_titles.add(title)
 
     print(f"Total unique articles found: {len(unique_articles)}")
-    return unique_articles, errors
\ No newline at end of file
+    return unique_articles
+
+async def scrape_news_async(region, sources=None, max_workers=DEFAULT_MAX_WORKERS, deadline=DEFAULT_DEADLINE):
+    tasks = _news_tasks(region, sources)
+    articles, errors = await run_sources_async(tasks, max_workers=max_workers, deadline=deadline)
+    return _dedupe(articles), errors
+
+def scrape_news(region, sources=None, concurrent=True, max_workers=DEFAULT_MAX_WORKERS,
+                deadline=DEFAULT_DEADLINE):
+    if concurrent:
+        return run_sync(scrape_news_async(region, sources, max_workers=max_workers, deadline=deadline))
+
+    articles = []
+    errors = []
+    for name, func in _news_tasks(region, sources):
+        try:
+            articles.extend(func())
+        except Exception as e:
+            error_msg = f"Error scraping {name}: {e}"
+            print(error_msg)
+            errors.append(error_msg)
+    return _dedupe(articles), errors
\ No newline at end of file
@@ -0,0 +1,58 @@
+# pagination.py
+import contextvars
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import host_scheduler
+
+# Articles one paginated source may contribute; "0" (default) crawls every
+# page given, as sources did before pagination was shared.
+DEFAULT_MAX_ARTICLES = int(os.getenv("NEWS_MAX_ARTICLES_PER_SOURCE", "0"))
+
+
+def paginate(urls, fetch_page, max_articles=DEFAULT_MAX_ARTICLES, window=None):
+    """
+    Fetches `urls` (page 1, 2, ...) with `fetch_page(url) -> [article, ...]`,
+    up to `window` pages at a time, and merges the results in page order with
+    title dedup. Stops as soon as a page adds no unseen titles or, when
+    `max_articles` is non-zero, once that many are gathered. A failing first page raises; a failing later
+    page ends the crawl with what was gathered so far.
+    """
+    urls = list(urls)
+    articles = []
+    if not urls:
+        return articles
+    if window is None:
+        window = host_scheduler.concurrency_limit(urls[0])
+    window = max(1, window)
+
+    seen_titles = set()
+    executor = ThreadPoolExecutor(max_workers=window, thread_name_prefix="page")
+    try:
+        for start in range(0, len(urls), window):
+            batch = urls[start:start + window]
+            # Page threads inherit the caller's context (and so its deadline).
+            futures = [executor.submit(contextvars.copy_context().run, fetch_page, url) for url in batch]
+            for offset, future in enumerate(futures):
+                try:
+                    page_articles = future.result()
+                except Exception as e:
+                    if start + offset == 0:
+                        raise
+                    print(f"Error fetching page {batch[offset]}: {e}")
+                    return articles
+
+                added = 0
+                for article in page_articles:
+                    if article["title"] in seen_titles:
+                        continue
+                    articles.append(article)
+                    seen_titles.add(article["title"])
+                    added += 1
+                    if max_articles and len(articles) >= max_articles:
+                        return articles
+                if not added:
+                    return articles
+        return articles
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,79 @@
+# parse_cache.py
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import parse_pool
+
+# Number of (page, extractor) results remembered; one per scraped page is enough.
+MAX_ENTRIES = int(os.getenv("NEWS_PARSE_CACHE_ENTRIES", "1024"))
+# When set, every fetched page body is also saved here (see bench_parsers.py).
+RECORD_DIR = os.getenv("NEWS_RECORD_PAGES_DIR")
+
+_lock = threading.Lock()
+_entries = OrderedDict()
+_stats = {}
+
+
+def _record(source, skipped, seconds=0.0):
+    counts = _stats.setdefault(source, {"parsed": 0, "skipped": 0, "parse_seconds": 0.0})
+    counts["skipped" if skipped else "parsed"] += 1
+    counts["parse_seconds"] += seconds
+
+
+def _record_page(extract, digest, body):
+    # Named after the extractor so bench_parsers.py can replay it.
+    path = os.path.join(RECORD_DIR, f"{extract.__module__}.{extract.__name__}-{digest.hex()[:12]}.html")
+    try:
+        os.makedirs(RECORD_DIR, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(body)
+    except OSError as e:
+        print(f"[parse_cache] Could not record page for {extract.__name__}: {e}")
+
+
+def parse_articles(response, extract, source):
+    """
+    Builds the soup for `response` and runs `extract(soup)`, unless this
+    page's body hashes to the same value as last time, in which case the
+    previous article list is returned without parsing at all.
+    """
+    body = response.content
+    digest = hashlib.blake2b(body, digest_size=16).digest()
+    if RECORD_DIR:
+        _record_page(extract, digest, body)
+    key = (response.url, extract)
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None and entry[0] == digest:
+            _entries.move_to_end(key)
+            _record(source, skipped=True)
+            return [dict(article) for article in entry[1]]
+
+    start = time.perf_counter()
+    articles = parse_pool.parse(body, extract)
+    elapsed = time.perf_counter() - start
+
+    with _lock:
+        _entries[key] = (digest, [dict(article) for article in articles])
+        _entries.move_to_end(key)
+        while len(_entries) > MAX_ENTRIES:
+            _entries.popitem(last=False)
+        _record(source, skipped=False, seconds=elapsed)
+    return articles
+
+
+def skip_ratios():
+    """Per-source share of pages whose parse was skipped."""
+    with _lock:
+        return {
+            source: counts["skipped"] / (counts["parsed"] + counts["skipped"])
+            for source, counts in _stats.items()
+        }
+
+
+def stats():
+    with _lock:
+        return {source: dict(counts) for source, counts in _stats.items()}
@@ -0,0 +1,102 @@
+# parse_pool.py
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+
+import html_parser
+import http_client
+
+# Worker processes for soup building + extraction: "0" parses in the calling
+# thread (default), "auto" uses one per available core, or give a number.
+PROCESSES = os.getenv("NEWS_PARSE_PROCESSES", "0")
+# Workers are started fresh rather than forked from a threaded web process.
+START_METHOD = os.getenv("NEWS_PARSE_START_METHOD", "spawn")
+
+_lock = threading.Lock()
+_pool = None
+_disabled = False
+_sendable = {}
+
+
+def pool_size():
+    if PROCESSES == "auto":
+        try:
+            return len(os.sched_getaffinity(0))
+        except AttributeError:
+            return os.cpu_count() or 1
+    return max(0, int(PROCESSES))
+
+
+def _parse(body, extract):
+    soup = html_parser.make_soup(body, parse_only=html_parser.strainer_for(extract))
+    return extract(soup)
+
+
+def _parse_in_worker(body, extract):
+    # Ship back plain tuples, not dicts or soup objects.
+    return [tuple(article.items()) for article in _parse(body, extract)]
+
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        with _lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(
+                    max_workers=pool_size(), mp_context=multiprocessing.get_context(START_METHOD)
+                )
+    return _pool
+
+
+def _can_send(extract):
+    if extract not in _sendable:
+        try:
+            pickle.dumps(extract)
+            _sendable[extract] = True
+        except Exception as e:
+            print(f"[parse_pool] {extract!r} can't be sent to a worker, parsing it in-process: {e}")
+            _sendable[extract] = False
+    return _sendable[extract]
+
+
+def parse(body, extract):
+    """
+    Runs `extract` over the soup of `body`, in a worker process when the
+    pool is enabled. Extractors are sent by reference (module-level
+    functions, registered sources), so only the page bytes and the
+    compact article tuples cross the process boundary.
+
+    Waiting for a worker is bounded by the http_client deadline: past it
+    the job is cancelled and DeadlineExceeded raised.
+    """
+    global _disabled
+    if _disabled or pool_size() == 0 or not _can_send(extract):
+        return _parse(body, extract)
+    left = http_client.remaining()
+    if left is not None and left <= 0:
+        raise http_client.DeadlineExceeded(f"No time left to parse with {extract!r}")
+    try:
+        future = _get_pool().submit(_parse_in_worker, body, extract)
+        rows = future.result(timeout=http_client.remaining())
+    except FutureTimeout:
+        # Drops it if still queued; a worker already on it finishes unread.
+        future.cancel()
+        raise http_client.DeadlineExceeded(f"Deadline passed while parsing with {extract!r}") from None
+    except BrokenProcessPool as e:
+        # Workers that can't start or keep dying: stay in-process from now on.
+        print(f"[parse_pool] Falling back to in-process parsing: {e}")
+        _disabled = True
+        return _parse(body, extract)
+    return [dict(row) for row in rows]
+
+
+def shutdown():
+    global _pool
+    with _lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,121 @@
+# ranking_service.py
+import os
+import re
+import threading
+
+MODEL = os.getenv("NEWS_GEMINI_MODEL", "models/gemini-1.5-flash")
+# Seconds one ranking call may take before the digest goes out unranked.
+TIMEOUT = float(os.getenv("NEWS_GEMINI_TIMEOUT", "30"))
+MAX_RETRIES = int(os.getenv("NEWS_GEMINI_RETRIES", "2"))
+
+# Part of every score cache key; bump it whenever the ranking prompt changes.
+PROMPT_VERSION = "2"
+
+# Given to articles the reply has no score for: below anything the model
+# gives, so they rank last instead of vanishing from the digest.
+UNSCORED = 0
+
+_SCORE_LINE_RE = re.compile(r"^\s*(\d+)\s*[:=]\s*(\d+)", re.MULTILINE)
+
+
+def build_ranking_prompt(articles):
+    prompt = (
+        "You are an expert news assistant. "
+        "Given the following numbered list of news headlines (with their sources), "
+        "for each headline, assign an importance score from 1 (least important) to 10 (most important) for inclusion in an education news digest. "
+        "Consider newsworthiness, impact, and diversity. "
+        "Reply with one line per headline in the form <number>:<score> and nothing else.\n\n"
+    )
+    prompt += "".join(
+        f"{idx}. {article.get('source', 'Unknown Source')} | {article['title']}\n"
+        for idx, article in enumerate(articles, 1)
+    )
+    return prompt
+
+
+def parse_ranking_output(text, articles):
+    """
+    (article, score) pairs for the "<number>:<score>" lines of a reply, in
+    reply order, followed by the articles it skipped at UNSCORED.
+    """
+    by_id = {idx: article for idx, article in enumerate(articles, 1)}
+    scored_articles = []
+    for match in _SCORE_LINE_RE.finditer(text):
+        article = by_id.pop(int(match.group(1)), None)
+        if article is not None:
+            scored_articles.append((article, min(max(int(match.group(2)), 1), 10)))
+    if by_id:
+        print(f"[Gemini] No score returned for {len(by_id)} of {len(articles)} articles.")
+        scored_articles += [(article, UNSCORED) for article in by_id.values()]
+    return scored_articles
+
+
+class RankingService:
+    """
+    Scores headlines with Gemini through one long-lived client, shared by
+    every request thread. langchain is imported and the client built on
+    first use, so importing the app (or a worker) doesn't pay for either.
+    """
+
+    def __init__(self, model=MODEL, timeout=TIMEOUT, max_retries=MAX_RETRIES, api_key=None):
+        self.model = model
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self._api_key = api_key
+        self._llm = None
+        self._lock = threading.Lock()
+
+    @property
+    def api_key(self):
+        return self._api_key or os.getenv("GOOGLE_API_KEY")
+
+    def available(self):
+        return bool(self.api_key)
+
+    @property
+    def cache_version(self):
+        """Scores depend on the prompt and on the model that gave them."""
+        return f"{PROMPT_VERSION}/{self.model}"
+
+    def _client(self):
+        if self._llm is None:
+            with self._lock:
+                if self._llm is None:
+                    from langchain_google_genai import ChatGoogleGenerativeAI
+
+                    self._llm = ChatGoogleGenerativeAI(
+                        model=self.model,
+                        google_api_key=self.api_key,
+                        timeout=self.timeout,
+                        max_retries=self.max_retries,
+                    )
+        return self._llm
+
+    def score(self, articles):
+        """(article, score) pairs for `articles`; articles the model skipped score UNSCORED."""
+        from langchain_core.messages import HumanMessage
+
+        print(f"[Gemini] Calling {self.model} to score {len(articles)} articles...")
+        response = self._client().invoke([HumanMessage(content=build_ranking_prompt(articles))])
+        print("[Gemini] Gemini LLM API call completed.")
+        usage = getattr(response, "usage_metadata", None) or {}
+        print(f"[Gemini] Tokens: {usage.get('input_tokens', '?')} prompt, {usage.get('output_tokens', '?')} output.")
+        print("Gemini raw output:\n", response.content)
+        return parse_ranking_output(str(response.content), articles)
+
+    def count_tokens(self, text):
+        return self._client().get_num_tokens(text)
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get():
+    """The process-wide ranking service."""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = RankingService()
+    return _service
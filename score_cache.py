@@ -0,0 +1,100 @@
+# score_cache.py
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from near_duplicates import canonical_url
+from title_normalizer import normalize
+
+# How long an LLM importance score is reused for the same headline.
+TTL = float(os.getenv("NEWS_SCORE_CACHE_TTL", "3600"))
+MAX_ENTRIES = int(os.getenv("NEWS_SCORE_CACHE_SIZE", "20000"))
+
+
+def fingerprint(article):
+    text = f"{canonical_url(article.get('url'))}\n{normalize(article.get('title')).lower()}"
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=12).hexdigest()
+
+
+class ScoreCache:
+    """
+    TTL + LRU cache of LLM scores keyed by (prompt version, category,
+    article fingerprint). Bumping the prompt version orphans old scores,
+    which then age out.
+    """
+
+    def __init__(self, ttl=TTL, max_entries=MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def lookup(self, prompt_version, category, articles):
+        """Splits `articles` into ([(article, cached score)], [unscored articles])."""
+        scored, unscored = [], []
+        now = time.monotonic()
+        with self._lock:
+            for article in articles:
+                key = (prompt_version, category, fingerprint(article))
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] < now:
+                    del self._entries[key]
+                    entry = None
+                if entry is None:
+                    self.misses += 1
+                    unscored.append(article)
+                    continue
+                self._entries.move_to_end(key)
+                self.hits += 1
+                scored.append((article, entry[1]))
+        return scored, unscored
+
+    def store(self, prompt_version, category, scored):
+        expires = time.monotonic() + self.ttl
+        with self._lock:
+            for article, score in scored:
+                key = (prompt_version, category, fingerprint(article))
+                self._entries[key] = (expires, score)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+_cache = ScoreCache()
+
+
+def lookup(prompt_version, category, articles):
+    return _cache.lookup(prompt_version, category, articles)
+
+
+def store(prompt_version, category, scored):
+    _cache.store(prompt_version, category, scored)
+
+
+def stats():
+    return _cache.stats()
+
+
+def clear():
+    _cache.clear()
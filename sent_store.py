@@ -0,0 +1,164 @@
+# sent_store.py
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+from near_duplicates import canonical_url, tokens
+
+DB_PATH = os.getenv(
+    "NEWS_SENT_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".sent_articles.sqlite3")
+)
+ENABLED = os.getenv("NEWS_SENT_STORE", "1") != "0"
+# Deliveries older than this are forgotten (and may be sent again).
+RETENTION_DAYS = float(os.getenv("NEWS_SENT_RETENTION_DAYS", "14"))
+# Pruning runs on write, at most this often.
+PRUNE_INTERVAL = 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sent (
+    recipient TEXT NOT NULL,
+    url_hash TEXT NOT NULL,
+    title_hash TEXT NOT NULL,
+    sent_at REAL NOT NULL,
+    PRIMARY KEY (recipient, url_hash)
+);
+CREATE INDEX IF NOT EXISTS sent_recipient_title ON sent (recipient, title_hash);
+CREATE INDEX IF NOT EXISTS sent_at ON sent (sent_at);
+"""
+
+_lock = threading.Lock()
+_initialised = False
+_last_prune = 0.0
+
+
+def _hash(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def fingerprints(article):
+    """(canonical URL hash, headline fingerprint) of an article."""
+    url_hash = _hash(canonical_url(article.get("url")))
+    title = " ".join(sorted(tokens(article.get("title") or "")))
+    return url_hash, _hash(title) if title else url_hash
+
+
+def _connect():
+    global _initialised
+    conn = sqlite3.connect(DB_PATH, timeout=5)
+    if not _initialised:
+        with _lock:
+            if not _initialised:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+                _initialised = True
+    return conn
+
+
+def _recipient(address):
+    return address.strip().lower()
+
+
+def filter_unsent(recipients, articles):
+    """
+    Drops articles every one of `recipients` already received within the
+    retention window, matched by canonical URL or headline fingerprint.
+    """
+    if not ENABLED or not recipients or not articles:
+        return articles
+    recipients = sorted({_recipient(r) for r in recipients})
+    cutoff = time.time() - RETENTION_DAYS * 86400
+    try:
+        conn = _connect()
+        try:
+            rows = conn.execute(
+                f"SELECT recipient, url_hash, title_hash FROM sent "
+                f"WHERE recipient IN ({', '.join('?' * len(recipients))}) AND sent_at >= ?",
+                (*recipients, cutoff),
+            ).fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"[sent_store] Not filtering sent articles: {e}")
+        return articles
+
+    seen = {}
+    for recipient, url_hash, title_hash in rows:
+        seen.setdefault(url_hash, set()).add(recipient)
+        seen.setdefault(title_hash, set()).add(recipient)
+    everyone = set(recipients)
+    unsent = []
+    for article in articles:
+        url_hash, title_hash = fingerprints(article)
+        if seen.get(url_hash, set()) | seen.get(title_hash, set()) >= everyone:
+            continue
+        unsent.append(article)
+    if len(unsent) < len(articles):
+        print(f"[sent_store] Skipping {len(articles) - len(unsent)} articles already sent.")
+    return unsent
+
+
+def record_sent(recipients, articles):
+    """
+    Remembers that `articles` went out to `recipients` now. Other outlets'
+    versions (`also_reported_by`) are recorded only when they have the same
+    URL or headline; merely similar stories may not be the one delivered.
+    """
+    if not ENABLED or not recipients or not articles:
+        return
+    now = time.time()
+    # One row per URL (the table's key): the emailed headline wins over a
+    # same-URL version's, so its fingerprint isn't overwritten.
+    delivered = {}
+    for article in articles:
+        url_hash, title_hash = fingerprints(article)
+        delivered[url_hash] = title_hash
+    for article in articles:
+        url_hash, title_hash = fingerprints(article)
+        for version in article.get("also_reported_by", ()):
+            version_url, version_title = fingerprints(version)
+            if version_title == title_hash:
+                delivered.setdefault(version_url, version_title)
+    rows = [(_recipient(recipient), url_hash, title_hash, now)
+            for recipient in recipients
+            for url_hash, title_hash in delivered.items()]
+    try:
+        conn = _connect()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO sent (recipient, url_hash, title_hash, sent_at) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+            _maybe_prune(conn, now)
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"[sent_store] Failed to record sent articles: {e}")
+
+
+def _maybe_prune(conn, now):
+    global _last_prune
+    with _lock:
+        if now - _last_prune < PRUNE_INTERVAL:
+            return
+        _last_prune = now
+    prune(conn)
+
+
+def prune(conn=None):
+    """Deletes deliveries older than the retention window; returns how many."""
+    close = conn is None
+    conn = conn or _connect()
+    try:
+        with conn:
+            deleted = conn.execute(
+                "DELETE FROM sent WHERE sent_at < ?", (time.time() - RETENTION_DAYS * 86400,)
+            ).rowcount
+    finally:
+        if close:
+            conn.close()
+    if deleted:
+        print(f"[sent_store] Pruned {deleted} deliveries older than {RETENTION_DAYS:g} days.")
+    return deleted
@@ -0,0 +1,79 @@
+# singleflight.py
+import threading
+import time
+
+
+class FlightTimeout(TimeoutError):
+    """A waiter ran out of time before the call it was waiting on finished."""
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        # Set when the leader ran out of its own time: what it got says
+        # nothing about callers that still have some.
+        self.cut_short = False
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key: the first caller runs
+    `fn`, everyone arriving while it is in flight waits for and shares its
+    result (or exception) instead of doing the work again.
+
+    Waiting is bounded by each caller's own `timeout`. An outcome the
+    leader only got because its time ran out (past its timeout, or one of
+    `deadline_errors`) is not shared; waiters with time left retry, the
+    first of them as the new leader.
+    """
+
+    def __init__(self, deadline_errors=()):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.deadline_errors = tuple(deadline_errors)
+
+    def do(self, key, fn, timeout=None):
+        """
+        Returns (result, shared); `shared` is True for callers that waited.
+        Raises FlightTimeout if `timeout` seconds pass while waiting.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = self._calls[key] = _Call()
+            if leader:
+                break
+
+            left = None if deadline is None else deadline - time.monotonic()
+            if left is not None and (left <= 0 or not call.done.wait(left)):
+                raise FlightTimeout(f"Timed out waiting for the in-flight call for {key!r}")
+            if left is None:
+                call.done.wait()
+            if call.cut_short:
+                continue
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            call.cut_short = isinstance(e, self.deadline_errors)
+            raise
+        finally:
+            if deadline is not None and time.monotonic() >= deadline:
+                call.cut_short = True
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,131 @@
+# source_cache.py
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import circuit_breaker
+import http_client
+from singleflight import FlightTimeout, SingleFlight
+
+# How long a source's parsed article list is served before re-scraping.
+TTL = float(os.getenv("NEWS_SOURCE_CACHE_TTL", "600"))
+# Rough upper bound on the memory held by cached article lists.
+MAX_BYTES = int(os.getenv("NEWS_SOURCE_CACHE_MAX_BYTES", str(8 * 1024 * 1024)))
+
+_ARTICLE_OVERHEAD = 240  # dict plus three str objects on CPython 3.11
+
+
+def _size_of(articles):
+    size = 56
+    for article in articles:
+        size += _ARTICLE_OVERHEAD + sum(len(str(value)) for value in article.values())
+    return size
+
+
+class SourceCache:
+    """
+    TTL + LRU cache of per-source article lists keyed by
+    (category, region, source). Entries are evicted least-recently-used
+    first once the estimated size exceeds `max_bytes`.
+    """
+
+    def __init__(self, ttl=TTL, max_bytes=MAX_BYTES):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return [dict(article) for article in entry[1]]
+
+    def put(self, key, articles):
+        articles = [dict(article) for article in articles]
+        size = _size_of(articles)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, articles, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key):
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+_cache = SourceCache()
+_flights = SingleFlight()
+
+
+def _scrape_and_store(key, func):
+    articles = func()
+    # An empty list is what every scraper returns on failure; don't pin it.
+    if articles:
+        _cache.put(key, articles)
+    return articles
+
+
+def cached_scrape(category, region, source, func):
+    key = (category, region, source)
+    articles = _cache.get(key)
+    if articles is not None:
+        return articles
+    # Concurrent digests asking for the same source share one scrape, and
+    # that scrape is skipped while the source's circuit is open. A caller
+    # waits no longer than its own deadline, and a scrape cut short by the
+    # leader's deadline is redone by waiters that still have time.
+    try:
+        articles, shared = _flights.do(
+            key, lambda: circuit_breaker.call(key, lambda: _scrape_and_store(key, func)),
+            timeout=http_client.remaining(),
+        )
+    except FlightTimeout:
+        # Like a scraper that hit its deadline: nothing, reported by the runner.
+        return []
+    if shared:
+        articles = [dict(article) for article in articles]
+    return articles
+
+
+def stats():
+    return _cache.stats()
+
+
+def clear():
+    _cache.clear()
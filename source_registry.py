@@ -0,0 +1,131 @@
+# source_registry.py
+import importlib
+
+import soupsieve
+
+from keyword_matcher import KeywordMatcher, compile_keywords
+from pagination import paginate
+from parse_cache import parse_articles
+
+# Every declared source, by "<module>.<scrape function name>".
+REGISTRY = {}
+
+
+class SourceSpec:
+    """
+    Declarative description of a headline-list source: which page(s) to
+    fetch, which selectors pick out the article links, and how titles and
+    hrefs are cleaned, filtered and made absolute. Selectors are compiled
+    once here; calling the spec with a soup runs the extraction.
+
+    `unrooted` says what happens to hrefs that are neither "/..." nor
+    "http...": "drop" them, "keep" them as they are, or "join" them onto
+    `base_url`.
+    """
+
+    def __init__(self, module, name, label, url, selectors, clean, session, base_url=None,
+                 keywords=None, skip_hrefs=(), href_contains=None, title_attr=None,
+                 title_selector=None, unrooted="drop", error_name=None, timeout=15):
+        self.__module__ = module
+        self.__name__ = name
+        self.label = label
+        self.urls = [url] if isinstance(url, str) else list(url)
+        self.selectors = list(selectors)
+        self.clean = clean
+        self.session = session
+        self.base_url = base_url
+        if keywords and not isinstance(keywords, KeywordMatcher):
+            keywords = compile_keywords(keywords)
+        self.keywords = keywords or None
+        self.skip_hrefs = tuple(skip_hrefs)
+        self.href_contains = href_contains
+        self.title_attr = title_attr
+        self.title_selector = title_selector
+        self.unrooted = unrooted
+        self.error_name = error_name or label
+        self.timeout = timeout
+        # One selector list, one walk of the tree: matches come back once each,
+        # in document order, however many of the selectors they satisfy.
+        self._compiled = soupsieve.compile(", ".join(self.selectors))
+        self._title_compiled = soupsieve.compile(title_selector) if title_selector else None
+
+    def _title_of(self, tag):
+        if self._title_compiled is not None:
+            title_tag = self._title_compiled.select_one(tag)
+            return self.clean(title_tag.get_text()) if title_tag else None
+        if self.title_attr:
+            return self.clean(tag.get(self.title_attr))
+        return self.clean(tag.get_text())
+
+    def _absolute(self, href):
+        if href.startswith("http"):
+            return href
+        if href.startswith("/") or self.unrooted == "join":
+            return (self.base_url or "") + href
+        return href if self.unrooted == "keep" else None
+
+    def __call__(self, soup):
+        return self._extract(self._compiled.select(soup))
+
+    def _extract(self, tags):
+        articles = []
+        seen_titles = set()
+        for tag in tags:
+            title = self._title_of(tag)
+            href = tag.get("href", "")
+            if not title or not href or title in seen_titles:
+                continue
+            if self.skip_hrefs and any(skip in href for skip in self.skip_hrefs):
+                continue
+            if self.href_contains and self.href_contains not in href:
+                continue
+            if self.keywords and not self.keywords.search(title):
+                continue
+            href = self._absolute(href)
+            if href is None:
+                continue
+            articles.append({"title": title, "url": href, "source": self.label})
+            seen_titles.add(title)
+        return articles
+
+    def __reduce__(self):
+        # Pickled by name (for the parse process pool); the worker imports
+        # the declaring module and picks the spec up from its registry.
+        return _lookup, (self.__module__, self.__name__)
+
+    def scrape(self):
+        try:
+            session = self.session()
+
+            def fetch_page(url):
+                response = session.get(url, timeout=self.timeout)
+                return parse_articles(response, self, self.label)
+
+            if len(self.urls) == 1:
+                return fetch_page(self.urls[0])
+            return paginate(self.urls, fetch_page)
+        except Exception as e:
+            print(f"Error scraping {self.error_name}: {e}")
+            return []
+
+
+def _lookup(module, name):
+    importlib.import_module(module)
+    return REGISTRY[f"{module}.{name}"]
+
+
+def register(module, name, label, url, selectors, **options):
+    """
+    Declares a source and returns its scrape function (named `name`), so
+    it slots into the category source maps like a hand-written scraper.
+    """
+    spec = SourceSpec(module, name, label, url, selectors, **options)
+    REGISTRY[f"{module}.{name}"] = spec
+
+    def scrape():
+        return spec.scrape()
+
+    scrape.__name__ = scrape.__qualname__ = name
+    scrape.__module__ = module
+    scrape.spec = spec
+    return scrape
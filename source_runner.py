@@ -0,0 +1,129 @@
+# source_runner.py
+import asyncio
+import contextvars
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import http_client
+import source_cache
+
+DEFAULT_MAX_WORKERS = 8  # sources in flight per digest
+DEFAULT_DEADLINE = 30  # seconds for a whole fan-out, not per source
+SOURCE_TIMEOUT = float(os.getenv("NEWS_SOURCE_TIMEOUT", "20"))
+
+# Scrapers are blocking (requests + BeautifulSoup), so the event loop hands
+# them to this shared pool; the loop itself only schedules, times out and
+# cancels. Sized for a few concurrent digests' worth of sources.
+_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("NEWS_SCRAPE_THREADS", "32")),
+    thread_name_prefix="scrape",
+)
+
+
+async def run_blocking(func, *args):
+    """Runs a blocking call on the scrape pool, keeping the caller's context."""
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(_executor, lambda: ctx.run(func, *args))
+
+
+async def fetch(url, **kwargs):
+    """Async GET through the shared pooled client (caches, politeness included)."""
+    return await run_blocking(lambda: http_client.get(url, **kwargs))
+
+
+async def run_sources_async(tasks, max_workers=DEFAULT_MAX_WORKERS, deadline=DEFAULT_DEADLINE,
+                            source_timeout=SOURCE_TIMEOUT):
+    """
+    Runs (name, func) scraper tasks concurrently on the running event loop
+    and returns (articles, errors). At most `max_workers` sources are in
+    flight; each gets `source_timeout` seconds and the whole set `deadline`
+    seconds. Sources cut off by either are cancelled, reported in `errors`
+    and their results dropped. Articles keep the order of `tasks` so the
+    caller's dedup stays deterministic.
+    """
+    articles = []
+    errors = []
+    if not tasks:
+        return articles, errors
+
+    semaphore = asyncio.Semaphore(max(1, max_workers))
+    digest_deadline = None if deadline is None else time.monotonic() + deadline
+
+    async def run_one(func):
+        async with semaphore:
+            source_deadline = time.monotonic() + source_timeout
+            if digest_deadline is not None:
+                source_deadline = min(source_deadline, digest_deadline)
+            # Requests still running past the deadline fail fast inside the
+            # worker thread, which is what actually frees it.
+            http_client.set_deadline(source_deadline)
+            articles = await asyncio.wait_for(run_blocking(func), source_deadline - time.monotonic())
+            # Scrapers swallow their own errors, so a request cut short by the
+            # deadline shows up as an empty list; report it as the timeout it is.
+            if not articles and time.monotonic() >= source_deadline:
+                raise asyncio.TimeoutError()
+            return articles
+
+    pending = [asyncio.create_task(run_one(func)) for _, func in tasks]
+    done, not_done = await asyncio.wait(pending, timeout=deadline)
+    for task in not_done:
+        task.cancel()
+
+    for (name, _), task in zip(tasks, pending):
+        if task in not_done:
+            error_msg = f"Error scraping {name}: timed out after {deadline}s"
+        elif isinstance(task.exception(), asyncio.TimeoutError):
+            limit = source_timeout if deadline is None else min(source_timeout, deadline)
+            error_msg = f"Error scraping {name}: timed out after {limit}s"
+        elif task.exception() is not None:
+            error_msg = f"Error scraping {name}: {task.exception()}"
+        else:
+            articles.extend(task.result())
+            continue
+        print(error_msg)
+        errors.append(error_msg)
+
+    return articles, errors
+
+
+def run_sync(coro):
+    """Drives `coro` on a fresh event loop; for the sync entry points."""
+    return asyncio.run(coro)
+
+
+def run_sources(tasks, max_workers=DEFAULT_MAX_WORKERS, deadline=DEFAULT_DEADLINE):
+    return run_sync(run_sources_async(tasks, max_workers=max_workers, deadline=deadline))
+
+
+def _scrape_source(category, region, src, func):
+    articles = source_cache.cached_scrape(category, region, src, func)
+    print(f"{category} ({region} - {src}): {len(articles)} articles")
+    return articles
+
+
+def source_tasks(category, source_map, region, sources=None):
+    """
+    (name, func) tasks for `sources` (all of `source_map` when None), each
+    served through the source cache under (category, region, name).
+    """
+    if sources is None:
+        sources = list(source_map)
+    return [(src, partial(_scrape_source, category, region, src, source_map[src])) for src in sources if src in source_map]
+
+
+async def scrape_category_async(category, source_map, region, sources=None, deadline=DEFAULT_DEADLINE, errors=None):
+    """
+    A category entry point: scrapes its sources concurrently and returns
+    their articles, appending per-source errors to `errors` if given.
+    """
+    articles, source_errors = await run_sources_async(source_tasks(category, source_map, region, sources), deadline=deadline)
+    if errors is not None:
+        errors.extend(source_errors)
+    return articles
+
+
+def scrape_category(category, source_map, region, sources=None, deadline=DEFAULT_DEADLINE, errors=None):
+    return run_sync(scrape_category_async(category, source_map, region, sources, deadline=deadline, errors=errors))
@@ -1,25 +1,24 @@
-import requests
-from bs4 import BeautifulSoup
-import time
-from time import sleep
+from urllib.parse import urlencode
+import http_client
+from pagination import paginate
+from functools import partial
+from keyword_matcher import compile_keywords
+from source_registry import register
+from source_runner import scrape_category_async, run_sync, DEFAULT_DEADLINE
+from title_normalizer import normalize as clean_title
 
 
-def clean_text(text):
-    return ' '.join(text.strip().split())
-
 def get_session():
-    session = requests.Session()
-    session.headers.update({"User-Agent": "Mozilla/5.0"})
-    return session
-
-def clean_title(text):
-    return clean_text(text.replace("\n", " ").replace("\xa0", " "))
+    return http_client.get_session({"User-Agent": "Mozilla/5.0"})
 
 def ensure_absolute(url: str) -> str:
     if url.startswith(('http://', 'https://')):
         return url
     return f"https://www.euronews.com/{url.lstrip('/')}"
 
+# Sources that are a plain headline-link list are declared, not hand-written.
+_source = partial(register, __name__, clean=clean_title, session=get_session)
+
 technology_keywords = [
     "technology", "tech", "ai", "artificial intelligence", "machine learning", "deep learning",
     "data science", "robotics", "quantum", "5g", "iot", "cybersecurity", "hacking", "software",
@@ -27,207 +26,109 @@ technology_keywords = [
     "internet", "app", "programming", "coding", "developer", "python", "javascript",
     "meta", "google", "microsoft", "apple", "openai", "chatgpt", "elon", "tesla", "neuralink"
 ]
+technology_matcher = compile_keywords(technology_keywords)
 
 # --- INDIA SOURCES ---
 
-def scrape_hindustan_times_tech():
-    try:
-        session = get_session()
-        url = "https://www.hindustantimes.com/technology"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-        seen_titles = set()
-        divs = soup.select('div.cartHolder.listView')
-        for div in divs:
-            a_tag = div.select_one('h3.hdg3 a')
-            if not a_tag:
-                continue
-            title = clean_title(a_tag.get_text())
-            href = a_tag.get('href', '')
-            if not any(kw in title.lower() for kw in technology_keywords):
-                continue
-            if title and title not in seen_titles and href:
-                if href.startswith('/'):
-                    href = "https://www.hindustantimes.com" + href
-                articles.append({"title": title, "url": href, "source": "Hindustan Times"})
-                seen_titles.add(title)
-        return articles
-    except Exception as e:
-        print(f"Error scraping Hindustan Times: {e}")
-        return []
-
-def scrape_ndtv_tech():
-    try:
-        session = get_session()
-        url = "https://www.ndtv.com/technology"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-        seen_titles = set()
-        for tag in soup.select('.newsHdng a, .SrchLstPg_ttl-lnk a, h2 a, h3 a'):
-            title = clean_title(tag.get_text())
-            href = tag.get('href', '')
-            if not any(kw in title.lower() for kw in technology_keywords):
-                continue
-            if title and title not in seen_titles and href:
-                if href.startswith('/'):
-                    href = "https://www.ndtv.com" + href
-                articles.append({"title": title, "url": href, "source": "NDTV"})
-                seen_titles.add(title)
-        return articles
-    except Exception as e:
-        print(f"Error scraping NDTV: {e}")
-        return []
-
-def scrape_deccan_herald_tech():
-    try:
-        session = get_session()
-        url = "https://www.deccanherald.com/sci-tech/technology"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-        seen_titles = set()
-        # Find all story cards in the technology section
-        for story_card in soup.find_all('div', class_='story-card-15'):
-            h2 = story_card.find('h2', class_='headline')
-            if not h2:
-                continue
-            a_tag = h2.find('a', href=True)
-            if not a_tag:
-                continue
-            title = clean_title(a_tag.text)
-            if not any(kw in title.lower() for kw in technology_keywords):
-                continue
-            href = a_tag['href']
-            if href.startswith('/'):
-                href = "https://www.deccanherald.com" + href
-            if title not in seen_titles:
-                articles.append({"title": title, "url": href, "source": "Deccan Herald"})
-                seen_titles.add(title)
-        return articles
-    except Exception as e:
-        print(f"Error scraping Deccan Herald: {e}")
-        return []
-
-def scrape_financial_express_tech():
-    url = "https://www.financialexpress.com/about/technology-news/"
-    headers = {"User-Agent": "Mozilla/5.0"}
-    try:
-        response = requests.get(url, headers=headers, timeout=10)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-        seen_titles = set()
-        for article in soup.find_all("article"):
-            title_tag = article.find("div", class_="entry-title")
-            if not title_tag:
-                continue
-            a_tag = title_tag.find("a", href=True)
-            if not a_tag:
-                continue
-            title = clean_text(a_tag.text)
-            href = a_tag["href"]
-            if title and title not in seen_titles:
-                articles.append({"title": title, "url": href, "source": "Financial Express"})
-                seen_titles.add(title)
-        return articles
-    except Exception as e:
-        print(f"Error scraping Financial Express: {e}")
-        return []
-
-def scrape_indian_express_tech():
-    try:
-        session = get_session()
-        url = "https://indianexpress.com/section/technology/"
-        response = session.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-        seen_titles = set()
-        for tag in soup.select('h3 a, h2 a'):
-            title = clean_title(tag.get_text())
-            href = tag.get('href', '')
-            if not any(kw in title.lower() for kw in technology_keywords):
-                continue
-            if title and title not in seen_titles:
-                if href.startswith('/'):
-                    href = "https://indianexpress.com" + href
-                articles.append({"title": title, "url": href, "source": "Indian Express"})
-                seen_titles.add(title)
-        return articles
-    except Exception as e:
-        print(f"Error scraping Indian Express: {e}")
-        return []
+scrape_hindustan_times_tech = _source(
+    "scrape_hindustan_times_tech",
+    "Hindustan Times",
+    "https://www.hindustantimes.com/technology",
+    selectors=['div.cartHolder.listView h3.hdg3 a'],
+    base_url="https://www.hindustantimes.com",
+    keywords=technology_matcher,
+    unrooted="keep",
+)
+
+scrape_ndtv_tech = _source(
+    "scrape_ndtv_tech",
+    "NDTV",
+    "https://www.ndtv.com/technology",
+    selectors=['.newsHdng a, .SrchLstPg_ttl-lnk a, h2 a, h3 a'],
+    base_url="https://www.ndtv.com",
+    keywords=technology_matcher,
+    unrooted="keep",
+)
+
+scrape_deccan_herald_tech = _source(
+    "scrape_deccan_herald_tech",
+    "Deccan Herald",
+    "https://www.deccanherald.com/sci-tech/technology",
+    selectors=['div.story-card-15 h2.headline a[href]'],
+    base_url="https://www.deccanherald.com",
+    keywords=technology_matcher,
+    unrooted="keep",
+)
+
+scrape_financial_express_tech = _source(
+    "scrape_financial_express_tech",
+    "Financial Express",
+    "https://www.financialexpress.com/about/technology-news/",
+    selectors=['article div.entry-title a[href]'],
+    unrooted="keep",
+    timeout=10,
+)
+
+scrape_indian_express_tech = _source(
+    "scrape_indian_express_tech",
+    "Indian Express",
+    "https://indianexpress.com/section/technology/",
+    selectors=['h3 a', 'h2 a'],
+    base_url="https://indianexpress.com",
+    keywords=technology_matcher,
+    unrooted="keep",
+)
 
 # --- GLOBAL SOURCES ---
 
-def scrape_guardian_tech():
-    try:
-        url = "https://www.theguardian.com/technology"
-        response = requests.get(url, timeout=15)
-        soup = BeautifulSoup(response.content, "html.parser")
-        articles = []
-        seen_titles = set()
-        for tag in soup.select('a[aria-label]'):
-            title = clean_title(tag.get('aria-label'))
-            href = tag.get('href', '')
-            if not any(kw in title.lower() for kw in technology_keywords):
-                continue
-            if title and href and '/202' in href and title not in seen_titles:
-                articles.append({"title": title, "url": href, "source": "The Guardian"})
-                seen_titles.add(title)
-        return articles
-    except Exception as e:
-        print(f"Error scraping Guardian Tech: {e}")
-        return []
-
-def scrape_euronews(query="technology", max_pages=3, delay=0.3):
+scrape_guardian_tech = _source(
+    "scrape_guardian_tech",
+    "The Guardian",
+    "https://www.theguardian.com/technology",
+    selectors=['a[aria-label]'],
+    keywords=technology_matcher,
+    href_contains='/202',
+    title_attr='aria-label',
+    unrooted="keep",
+    error_name="Guardian Tech",
+)
+
+# Hand-written: a JSON search API, not a headline page.
+def scrape_euronews(query="technology", max_pages=3):
     api_url = "https://www.euronews.com/api/search"
-    headers = {"User-Agent": "Mozilla/5.0"}
-    articles = []
-    for page in range(1, max_pages + 1):
-        print(f"🔎 Scraping Euronews page {page}...")
-        params = {"query": query, "page": page, "size": 10}
-        try:
-            res = requests.get(api_url, headers=headers, params=params, timeout=15)
-            res.raise_for_status()
-            results = res.json()
-            if not isinstance(results, list) or not results:
-                print("🛑 No more results.")
-                break
-        except Exception as exc:
-            print(f"❌ Page {page} failed: {exc}")
-            break
+    session = get_session()
+
+    def fetch_page(page_url):
+        print(f"🔎 Scraping Euronews page {page_url}...")
+        res = session.get(page_url, timeout=15)
+        res.raise_for_status()
+        results = res.json()
+        articles = []
+        if not isinstance(results, list) or not results:
+            print("🛑 No more results.")
+            return articles
         for item in results:
-            title = clean_text(item.get("title", ""))
+            title = clean_title(item.get("title", ""))
             url = ensure_absolute(item.get("url", ""))
             if title and url:
                 articles.append({"title": title, "url": url, "source": "Euronews"})
-        sleep(delay)
-    return articles
+        return articles
 
-def scrape_cnbc_tech():
-    url = "https://www.cnbc.com/technology/"
-    headers = {"User-Agent": "Mozilla/5.0"}
+    urls = [f"{api_url}?{urlencode({'query': query, 'page': page, 'size': 10})}" for page in range(1, max_pages + 1)]
     try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-        articles = []
-        seen_titles = set()
-        cards = soup.find_all("div", attrs={"data-test": "Card"})
-        for card in cards:
-            title_tag = card.find("a", class_="Card-title")
-            if title_tag and title_tag.text and title_tag['href']:
-                title = clean_text(title_tag.text)
-                href = title_tag['href']
-                if title not in seen_titles:
-                    articles.append({"title": title, "url": href, "source": "CNBC"})
-                    seen_titles.add(title)
-        return articles
-    except Exception as e:
-        print(f"Error scraping CNBC: {e}")
+        return paginate(urls, fetch_page)
+    except Exception as exc:
+        print(f"❌ Euronews failed: {exc}")
         return []
 
+scrape_cnbc_tech = _source(
+    "scrape_cnbc_tech",
+    "CNBC",
+    "https://www.cnbc.com/technology/",
+    selectors=['div[data-test="Card"] a.Card-title[href]'],
+    unrooted="keep",
+)
+
 # --- WRAPPER FUNCTIONS ---
 
 def scrape_india_tech_news():
@@ -260,35 +161,25 @@ def scrape_global_tech_news():
             print(f"Error during Global scraping: {e}")
     return all_articles
 
-def scrape_technology_news(region="India", sources=None):
-    india_source_map = {
-        "hindustan_times": scrape_hindustan_times_tech,
-        "ndtv": scrape_ndtv_tech,
-        "deccan_herald": scrape_deccan_herald_tech,
-        "financial_express": scrape_financial_express_tech,
-        "indian_express": scrape_indian_express_tech,
-    }
-    global_source_map = {
-        "guardian": scrape_guardian_tech,
-        "euronews": scrape_euronews,
-        "cnbc": scrape_cnbc_tech,
-    }
-    if region == "India":
-        source_map = india_source_map
-    else:
-        source_map = global_source_map
-    if sources is None:
-        sources = list(source_map.keys())
-    all_articles = []
-    for src in sources:
-        func = source_map.get(src)
-        if func:
-            try:
-                src_articles = func() if src != "euronews" else func()  # euronews takes default query
-                all_articles.extend(src_articles)
-            except Exception as e:
-                print(f"Error in scrape_technology_news for source {src}: {e}")
-    return all_articles
+india_source_map = {
+    "hindustan_times": scrape_hindustan_times_tech,
+    "ndtv": scrape_ndtv_tech,
+    "deccan_herald": scrape_deccan_herald_tech,
+    "financial_express": scrape_financial_express_tech,
+    "indian_express": scrape_indian_express_tech,
+}
+
+global_source_map = {
+    "guardian": scrape_guardian_tech,
+    "euronews": scrape_euronews,
+    "cnbc": scrape_cnbc_tech,
+}
+
+async def scrape_technology_news_async(region="India", sources=None, deadline=DEFAULT_DEADLINE, errors=None):
+    return await scrape_category_async("tech", india_source_map if region == "India" else global_source_map, region, sources, deadline, errors)
+
+def scrape_technology_news(region="India", sources=None, deadline=DEFAULT_DEADLINE, errors=None):
+    return run_sync(scrape_technology_news_async(region, sources, deadline=deadline, errors=errors))
 
 # --- MAIN ---
 
@@ -0,0 +1,52 @@
+import time
+
+import pytest
+
+import circuit_breaker
+import http_client
+
+
+@pytest.fixture(autouse=True)
+def fresh_breakers():
+    circuit_breaker.reset()
+    yield
+    circuit_breaker.reset()
+
+
+def _with_deadline(seconds, func):
+    token = http_client.set_deadline(time.monotonic() + seconds)
+    try:
+        return func()
+    finally:
+        http_client._deadline.reset(token)
+
+
+def test_empty_scrapes_open_the_circuit():
+    for _ in range(circuit_breaker.FAILURE_THRESHOLD):
+        circuit_breaker.call("source", list)
+    with pytest.raises(circuit_breaker.CircuitOpen):
+        circuit_breaker.call("source", list)
+
+
+def test_scrapes_cut_off_by_the_deadline_are_not_failures():
+    for _ in range(circuit_breaker.FAILURE_THRESHOLD + 1):
+        _with_deadline(-1, lambda: circuit_breaker.call("source", list))
+
+    def timed_out():
+        raise http_client.DeadlineExceeded("deadline")
+
+    for _ in range(circuit_breaker.FAILURE_THRESHOLD + 1):
+        with pytest.raises(http_client.DeadlineExceeded):
+            _with_deadline(-1, lambda: circuit_breaker.call("source", timed_out))
+
+    breaker = circuit_breaker.get("source")
+    assert breaker.state == circuit_breaker.CLOSED
+    assert breaker.failures == 0
+
+
+def test_inconclusive_trial_lets_the_next_probe_through():
+    breaker = circuit_breaker.get("source")
+    breaker.state = circuit_breaker.HALF_OPEN
+    _with_deadline(-1, lambda: circuit_breaker.call("source", list))
+    assert circuit_breaker.call("source", lambda: [{"title": "t"}]) == [{"title": "t"}]
+    assert breaker.state == circuit_breaker.CLOSED
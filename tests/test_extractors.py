@@ -0,0 +1,102 @@
+"""
+Every headline extractor (hand-written `_extract_*` functions and declared
+SourceSpecs) run over its fixture page, on the full tree and on the
+selector-restricted tree, against the articles recorded in expected.json.
+
+Pages live in fixtures/pages: `<module>.<name>.html` for an extractor's own
+page, `combined.html` for the rest. After an intended change in extraction,
+regenerate the expectations with
+
+    python tests/test_extractors.py --update
+"""
+import importlib
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import html_parser  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+PAGES = os.path.join(FIXTURES, "pages")
+EXPECTED = os.path.join(FIXTURES, "expected.json")
+MODULES = [
+    "news_sources", "business_and_finance", "entertainment", "environment", "health",
+    "higher_ed", "industry", "sports", "technology",
+]
+
+
+def extractors():
+    """{"module.name": extractor} for every extractor the scrapers parse pages with."""
+    found = {}
+    for module_name in MODULES:
+        module = importlib.import_module(module_name)
+        for name, value in vars(module).items():
+            if getattr(value, "__module__", None) != module_name:
+                continue
+            if hasattr(value, "spec"):
+                found[f"{module_name}.{name}"] = value.spec
+            elif name.startswith("_extract_") and callable(value):
+                found[f"{module_name}.{name}"] = value
+    return found
+
+
+def _page_for(qualified):
+    own = f"{qualified}.html"
+    return own if os.path.exists(os.path.join(PAGES, own)) else "combined.html"
+
+
+def _read(page):
+    with open(os.path.join(PAGES, page), "rb") as f:
+        return f.read()
+
+
+def _load_expected():
+    with open(EXPECTED, encoding="utf-8") as f:
+        return json.load(f)
+
+
+EXTRACTORS = extractors()
+
+
+def test_every_extractor_has_a_fixture():
+    assert sorted(_load_expected()) == sorted(EXTRACTORS)
+
+
+@pytest.mark.parametrize("qualified", sorted(EXTRACTORS))
+def test_full_tree(qualified):
+    expected = _load_expected()[qualified]
+    articles = EXTRACTORS[qualified](html_parser.make_soup(_read(expected["page"])))
+    assert articles == expected["articles"]
+    assert articles, "fixture page should yield articles"
+
+
+@pytest.mark.parametrize("qualified", sorted(EXTRACTORS))
+def test_restricted_tree(qualified):
+    extract = EXTRACTORS[qualified]
+    strainer = html_parser.strainer_for(extract)
+    if strainer is None:
+        pytest.skip("extractor needs the full tree")
+    expected = _load_expected()[qualified]
+    assert extract(html_parser.make_soup(_read(expected["page"]), parse_only=strainer)) == expected["articles"]
+
+
+def update():
+    expected = {}
+    for qualified, extract in sorted(EXTRACTORS.items()):
+        page = _page_for(qualified)
+        expected[qualified] = {"page": page, "articles": extract(html_parser.make_soup(_read(page)))}
+    with open(EXPECTED, "w", encoding="utf-8") as f:
+        json.dump(expected, f, indent=1, ensure_ascii=False)
+        f.write("\n")
+    print(f"Recorded {len(expected)} extractors in {EXPECTED}")
+
+
+if __name__ == "__main__":
+    if "--update" in sys.argv:
+        update()
+    else:
+        sys.exit(pytest.main([__file__, "-q"]))
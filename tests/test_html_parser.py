@@ -0,0 +1,52 @@
+import pytest
+
+import html_parser
+
+PAGE = b"""<html><body>
+<div class="story"><h3 class="title">Section</h3><a href="/one">First headline</a></div>
+<ul><li><a href="/two">Second headline</a></li></ul>
+</body></html>"""
+
+
+@pytest.mark.parametrize("selector", ["h3 + a", "h3 ~ a", "h3.title+a", "li:first-child a"])
+def test_selectors_reaching_siblings_need_the_full_tree(selector):
+    assert html_parser.tags_for_selectors([selector]) is None
+
+
+@pytest.mark.parametrize("selector, tags", [
+    ("h3.title > a", {"h3"}),
+    ("div.story h3 + a", {"div"}),
+    ('a[title="x + y"]', {"a"}),
+    ("h3:not(.x) a, li a", {"h3", "li"}),
+])
+def test_descendant_selectors_keep_their_outer_tag(selector, tags):
+    assert html_parser.tags_for_selectors([selector]) == tags
+
+
+@pytest.mark.parametrize("selector", ["div.story h3 + a", "li > a", "ul a"])
+def test_restricted_tree_matches_like_the_full_tree(selector):
+    tags = html_parser.tags_for_selectors([selector])
+    full = html_parser.make_soup(PAGE).select(selector)
+    strained = html_parser.make_soup(PAGE, parse_only=html_parser.SoupStrainer(sorted(tags))).select(selector)
+    assert [a["href"] for a in strained] == [a["href"] for a in full]
+
+
+def _extract_with_next(soup):
+    return [h3.next.get_text() for h3 in soup.select("h3")]
+
+
+def _extract_with_previous(soup):
+    return [a.previous for a in soup.select("div a")]
+
+
+def _extract_descendants(soup):
+    return [a.get_text() for a in soup.select("div.story a")]
+
+
+@pytest.mark.parametrize("extract", [_extract_with_next, _extract_with_previous])
+def test_extractors_navigating_outward_get_the_full_tree(extract):
+    assert html_parser._soup_tags(extract) is None
+
+
+def test_extractor_selectors_are_read_from_source():
+    assert html_parser._soup_tags(_extract_descendants) == {"div"}
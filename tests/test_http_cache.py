@@ -0,0 +1,93 @@
+import json
+import os
+import time
+
+import pytest
+import requests
+
+import http_cache
+import http_client
+
+
+def _response(status, body=b"", headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response._content_consumed = True
+    response.headers.update(headers or {})
+    response.url = "http://cache.test/"
+    return response
+
+
+class _FakeSession:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        self.sent.append(dict(headers or {}))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_cache, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(http_cache, "ENABLED", True)
+    monkeypatch.setattr(http_cache, "_last_prune", time.monotonic())
+    return tmp_path
+
+
+def _store(url, body=b"<html></html>", stored_at=None):
+    http_cache.store(url, _response(200, body, {"ETag": '"v1"'}))
+    if stored_at is not None:
+        meta_path, _ = http_cache._paths(url)
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        meta["stored_at"] = stored_at
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+
+def test_load_leaves_the_body_on_disk(cache_dir):
+    _store("http://cache.test/a", b"stored body")
+    entry = http_cache.load("http://cache.test/a")
+    assert entry["etag"] == '"v1"'
+    assert "body" not in entry
+    replayed = http_cache.replay(_response(304), entry)
+    assert replayed.status_code == 200
+    assert replayed.content == b"stored body"
+
+
+def test_load_drops_entries_past_max_age(cache_dir):
+    _store("http://cache.test/old", stored_at=time.time() - http_cache.MAX_AGE - 60)
+    assert http_cache.load("http://cache.test/old") is None
+    assert not any(os.path.exists(path) for path in http_cache._paths("http://cache.test/old"))
+
+
+def test_prune_removes_old_then_oldest_until_within_budget(cache_dir):
+    now = time.time()
+    _store("http://cache.test/expired", b"x" * 100, stored_at=now - 1000)
+    _store("http://cache.test/older", b"x" * 100, stored_at=now - 300)
+    _store("http://cache.test/newer", b"x" * 100, stored_at=now - 100)
+    entry_size = sum(os.path.getsize(path) for path in http_cache._paths("http://cache.test/newer"))
+
+    assert http_cache.prune(max_age=500, max_bytes=entry_size + 50) == 2
+    assert http_cache.load("http://cache.test/expired") is None
+    assert http_cache.load("http://cache.test/older") is None
+    assert http_cache.load("http://cache.test/newer") is not None
+
+
+def test_request_refetches_when_the_body_was_pruned_before_the_304(cache_dir, monkeypatch):
+    url = "http://cache.test/gone"
+    _store(url, b"old body")
+    session = _FakeSession(_response(304), _response(200, b"fresh body"))
+    monkeypatch.setattr(http_client, "get_shared_session", lambda: session)
+    # A prune lands between the revalidation and its 304.
+    entry = http_cache.load(url)
+    http_cache.clear()
+    monkeypatch.setattr(http_cache, "load", lambda u: entry)
+
+    response = http_client.request("GET", url)
+    assert response.content == b"fresh body"
+    assert session.sent[0].get("If-None-Match") == '"v1"'
+    assert "If-None-Match" not in session.sent[1]
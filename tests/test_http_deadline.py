@@ -0,0 +1,78 @@
+import time
+
+import pytest
+import requests
+
+import host_scheduler
+import http_client
+
+
+class _FakeSession:
+    def __init__(self):
+        self.sent = []
+
+    def request(self, method, url, headers=None, timeout=None, **kwargs):
+        self.sent.append((time.monotonic(), timeout))
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b""
+        return response
+
+
+@pytest.fixture
+def session(monkeypatch):
+    fake = _FakeSession()
+    monkeypatch.setattr(http_client, "get_shared_session", lambda: fake)
+    return fake
+
+
+def test_requests_past_the_deadline_are_not_sent(session):
+    host_scheduler.set_interval("deadline-spacing.test", 0.3)
+    url = "http://deadline-spacing.test/"
+    start = time.monotonic()
+    token = http_client.set_deadline(start + 0.45)
+    try:
+        http_client._send_once("GET", url, timeout=15)
+        http_client._send_once("GET", url, timeout=15)
+        with pytest.raises(http_client.DeadlineExceeded):
+            http_client._send_once("GET", url, timeout=15)
+    finally:
+        http_client._deadline.reset(token)
+
+    assert len(session.sent) == 2
+    (first_at, first_timeout), (second_at, second_timeout) = session.sent
+    assert first_timeout == pytest.approx(0.45, abs=0.05)
+    # The second waited for its turn; its timeout is what was left after that.
+    assert second_at - start == pytest.approx(0.3, abs=0.05)
+    assert second_timeout == pytest.approx(0.15, abs=0.05)
+    # The refused request did not push the host's next slot out.
+    assert host_scheduler.wait_turn(url, deadline=start + 0.65) is not None
+
+
+def test_host_slot_gives_up_at_the_deadline():
+    limiter = host_scheduler.HostLimiter(initial=1, minimum=1, maximum=1)
+    assert limiter.acquire()
+    started = time.monotonic()
+    assert limiter.acquire(deadline=started + 0.1) is False
+    assert time.monotonic() - started < 0.5
+    assert limiter.in_flight == 1
+
+
+class _TimingOutSession:
+    def request(self, method, url, headers=None, timeout=None, **kwargs):
+        raise requests.exceptions.ReadTimeout("timed out")
+
+
+@pytest.mark.parametrize("budget, halved", [(0.5, False), (60, True)])
+def test_only_full_timeouts_signal_congestion(monkeypatch, budget, halved):
+    monkeypatch.setattr(http_client, "get_shared_session", lambda: _TimingOutSession())
+    url = f"http://congestion-{budget}.test/"
+    before = host_scheduler.concurrency_limit(url)
+    token = http_client.set_deadline(time.monotonic() + budget)
+    try:
+        with pytest.raises(requests.exceptions.Timeout):
+            http_client._send_once("GET", url, timeout=10)
+    finally:
+        http_client._deadline.reset(token)
+    after = host_scheduler.concurrency_limit(url)
+    assert (after < before) is halved
@@ -0,0 +1,42 @@
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NameResolutionError, NewConnectionError
+
+import http_client
+
+
+def _connection_error(reason):
+    return requests.exceptions.ConnectionError(MaxRetryError(None, "/", reason))
+
+
+class _FailingSession:
+    def __init__(self, error):
+        self.error = error
+        self.attempts = 0
+
+    def request(self, method, url, headers=None, **kwargs):
+        self.attempts += 1
+        raise self.error
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(http_client, "_backoff", lambda attempt: 0)
+    monkeypatch.setattr(http_client, "MAX_RETRIES", 2)
+
+
+def test_dns_failures_are_not_retried(monkeypatch):
+    error = _connection_error(NameResolutionError("dns-fail.test", None, "Name or service not known"))
+    session = _FailingSession(error)
+    monkeypatch.setattr(http_client, "get_shared_session", lambda: session)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        http_client._send("GET", "http://dns-fail.test/")
+    assert session.attempts == 1
+
+
+def test_refused_connections_are_retried(monkeypatch):
+    session = _FailingSession(_connection_error(NewConnectionError(None, "Connection refused")))
+    monkeypatch.setattr(http_client, "get_shared_session", lambda: session)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        http_client._send("GET", "http://refused.test/")
+    assert session.attempts == 3
@@ -0,0 +1,52 @@
+import pytest
+
+import near_duplicates
+
+
+def _article(title, url, source="Source"):
+    return {"title": title, "url": url, "source": source}
+
+
+@pytest.mark.parametrize("first, second", [
+    ("Sensex falls 500 points, Nifty below 22,000", "Sensex rises 500 points, Nifty above 22,000"),
+    ("CBSE Class 10 results 2025 declared", "CBSE Class 12 results 2025 declared"),
+    ("IPL 2025: MI vs CSK live score", "IPL 2025: RCB vs KKR live score"),
+    ("Govt hikes repo rate by 25 bps", "RBI cuts repo rate 25 basis points"),
+    ("Govt hikes repo rate by 25 bps", "RBI raises repo rate 50 basis points"),
+])
+def test_different_stories_are_kept_apart(first, second):
+    articles = [_article(first, "https://a.example/1"), _article(second, "https://b.example/2")]
+    collapsed = near_duplicates.collapse(articles)
+    assert [a["title"] for a in collapsed] == [first, second]
+    assert all("also_reported_by" not in a for a in collapsed)
+
+
+def test_reworded_story_is_collapsed():
+    articles = [
+        _article("RBI keeps repo rate unchanged at 6.5%, markets rally", "https://ndtv.example/a", "NDTV"),
+        _article("India beat Australia in the third Test", "https://ndtv.example/b", "NDTV"),
+        _article("RBI keeps repo rate unchanged at 6.5%; markets rally", "https://ht.example/c", "HT"),
+    ]
+    collapsed = near_duplicates.collapse(articles)
+    assert [a["url"] for a in collapsed] == ["https://ndtv.example/a", "https://ndtv.example/b"]
+    assert collapsed[0]["also_reported_by"] == [
+        {"source": "HT", "title": articles[2]["title"], "url": "https://ht.example/c"}
+    ]
+
+
+def test_cross_outlet_wording_is_collapsed():
+    articles = [
+        _article("Govt hikes repo rate by 25 bps", "https://fe.example/a", "FE"),
+        _article("RBI raises repo rate 25 basis points", "https://ht.example/b", "HT"),
+    ]
+    collapsed = near_duplicates.collapse(articles)
+    assert [a["url"] for a in collapsed] == ["https://fe.example/a"]
+    assert collapsed[0]["also_reported_by"][0]["url"] == "https://ht.example/b"
+
+
+def test_same_url_is_collapsed():
+    articles = [
+        _article("Budget 2025 highlights", "https://www.site.example/budget/?utm=x"),
+        _article("Union Budget: key announcements", "http://site.example/budget"),
+    ]
+    assert len(near_duplicates.collapse(articles)) == 1
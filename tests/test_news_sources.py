@@ -0,0 +1,13 @@
+import pytest
+
+import news_sources
+
+
+@pytest.mark.parametrize("region", ["India", "Global"])
+def test_default_and_picked_sources_share_cache_keys(region):
+    default = news_sources._news_tasks(region, None)
+    names = [name for name, _ in default]
+    picked = news_sources._news_tasks(region, names)
+    assert [task.args[:3] for _, task in default] == [task.args[:3] for _, task in picked]
+    assert all(task.args[2] == name for name, task in default)
+    assert names[:2] == ["flipboard", "scoopit"]
@@ -0,0 +1,26 @@
+import pagination
+
+
+def _urls(count):
+    return [f"https://pages.test/{page}" for page in range(1, count + 1)]
+
+
+def _fetch(per_page):
+    def fetch_page(url):
+        page = url.rsplit("/", 1)[1]
+        return [{"title": f"Page {page} headline {n}", "url": f"{url}/{n}"} for n in range(per_page)]
+    return fetch_page
+
+
+def test_every_page_is_crawled_by_default():
+    # The Hindu sports crawls six pages of about twenty headlines each.
+    articles = pagination.paginate(_urls(6), _fetch(20), window=2)
+    assert len(articles) == 120
+    assert articles[0]["title"] == "Page 1 headline 0"
+    assert articles[-1]["title"] == "Page 6 headline 19"
+
+
+def test_max_articles_caps_the_crawl():
+    articles = pagination.paginate(_urls(6), _fetch(20), max_articles=50, window=2)
+    assert len(articles) == 50
+    assert articles[-1]["title"] == "Page 3 headline 9"
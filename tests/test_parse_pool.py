@@ -0,0 +1,54 @@
+import time
+from concurrent.futures import Future
+
+import pytest
+
+import http_client
+import parse_pool
+
+
+class _StuckPool:
+    """A pool whose workers never get to the job."""
+
+    def __init__(self):
+        self.futures = []
+
+    def submit(self, fn, *args):
+        future = Future()
+        self.futures.append(future)
+        return future
+
+
+@pytest.fixture
+def stuck_pool(monkeypatch):
+    pool = _StuckPool()
+    monkeypatch.setattr(parse_pool, "PROCESSES", "1")
+    monkeypatch.setattr(parse_pool, "_disabled", False)
+    monkeypatch.setattr(parse_pool, "_get_pool", lambda: pool)
+    return pool
+
+
+def _extract(soup):
+    return []
+
+
+def test_waiting_for_a_worker_stops_at_the_deadline(stuck_pool):
+    start = time.monotonic()
+    token = http_client.set_deadline(start + 0.1)
+    try:
+        with pytest.raises(http_client.DeadlineExceeded):
+            parse_pool.parse(b"<html></html>", _extract)
+    finally:
+        http_client._deadline.reset(token)
+    assert time.monotonic() - start < 0.5
+    assert stuck_pool.futures[0].cancelled()
+
+
+def test_nothing_is_submitted_past_the_deadline(stuck_pool):
+    token = http_client.set_deadline(time.monotonic() - 1)
+    try:
+        with pytest.raises(http_client.DeadlineExceeded):
+            parse_pool.parse(b"<html></html>", _extract)
+    finally:
+        http_client._deadline.reset(token)
+    assert stuck_pool.futures == []
@@ -0,0 +1,30 @@
+import bench_prompt
+import ranking_service
+
+
+def _articles(n):
+    return [{"title": f"Ranking test headline {i}", "url": f"https://rank.test/{i}", "source": "Rank"} for i in range(n)]
+
+
+def test_parse_ranking_output_reads_scores_in_reply_order():
+    articles = _articles(3)
+    scored = ranking_service.parse_ranking_output("3: 9\n1:4\n2=11\n", articles)
+    assert scored == [(articles[2], 9), (articles[0], 4), (articles[1], 10)]
+
+
+def test_articles_missing_from_the_reply_rank_last_instead_of_dropping():
+    articles = _articles(4)
+    scored = ranking_service.parse_ranking_output("2:8\n7:9\nsome chatter\n", articles)
+    assert scored == [
+        (articles[1], 8),
+        (articles[0], ranking_service.UNSCORED),
+        (articles[2], ranking_service.UNSCORED),
+        (articles[3], ranking_service.UNSCORED),
+    ]
+    assert all(ranking_service.UNSCORED < score for score in range(1, 11))
+
+
+def test_bench_prompt_handles_no_articles(monkeypatch, capsys):
+    monkeypatch.setattr(bench_prompt, "token_counter", lambda: ("estimated", len))
+    bench_prompt.main([])
+    assert "reply           0        0     0%" in capsys.readouterr().out
@@ -0,0 +1,36 @@
+import pytest
+
+import sent_store
+
+
+@pytest.fixture(autouse=True)
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(sent_store, "DB_PATH", str(tmp_path / "sent.sqlite3"))
+    monkeypatch.setattr(sent_store, "_initialised", False)
+    monkeypatch.setattr(sent_store, "ENABLED", True)
+
+
+def test_only_delivered_versions_are_recorded():
+    delivered = {
+        "title": "CBSE Class 10 results 2025 declared",
+        "url": "https://a.example/class-10",
+        "also_reported_by": [
+            {"source": "B", "title": "CBSE Class 12 results 2025 declared", "url": "https://b.example/class-12"},
+            {"source": "C", "title": "Results for class 10 declared", "url": "https://a.example/class-10?ref=c"},
+        ],
+    }
+    sent_store.record_sent(["reader@example.com"], [delivered])
+
+    candidates = [
+        {"title": "CBSE Class 12 results 2025 declared", "url": "https://b.example/class-12"},
+        {"title": "CBSE Class 10 results 2025 declared", "url": "https://other.example/x"},
+        {"title": "Something else", "url": "https://a.example/class-10/"},
+    ]
+    assert sent_store.filter_unsent(["Reader@example.com"], candidates) == candidates[:1]
+
+
+def test_articles_are_kept_until_every_recipient_has_them():
+    article = {"title": "Monsoon reaches Kerala early", "url": "https://a.example/monsoon"}
+    sent_store.record_sent(["one@example.com"], [article])
+    assert sent_store.filter_unsent(["one@example.com", "two@example.com"], [article]) == [article]
+    assert sent_store.filter_unsent(["one@example.com"], [article]) == []
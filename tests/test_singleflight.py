@@ -0,0 +1,108 @@
+import threading
+import time
+
+import pytest
+import requests
+
+import http_client
+from singleflight import FlightTimeout, SingleFlight
+
+
+class _CutShort(Exception):
+    pass
+
+
+def _start_leader(flights, key, fn, timeout=None):
+    """Runs `fn` as the leader for `key` on a thread; returns once it is in flight."""
+    started = threading.Event()
+    outcome = {}
+
+    def lead():
+        def work():
+            started.set()
+            return fn()
+
+        try:
+            outcome["result"] = flights.do(key, work, timeout=timeout)
+        except Exception as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=lead)
+    thread.start()
+    assert started.wait(1)
+    return thread, outcome
+
+
+def test_waiters_share_the_leaders_result():
+    flights = SingleFlight()
+    release = threading.Event()
+    thread, outcome = _start_leader(flights, "k", lambda: release.wait(1) and "page")
+    threading.Timer(0.05, release.set).start()
+    assert flights.do("k", lambda: "own") == ("page", True)
+    thread.join()
+    assert outcome["result"] == ("page", False)
+
+
+def test_a_waiter_gives_up_at_its_own_timeout():
+    flights = SingleFlight()
+    release = threading.Event()
+    thread, _ = _start_leader(flights, "k", lambda: release.wait(2))
+    started = time.monotonic()
+    with pytest.raises(FlightTimeout):
+        flights.do("k", lambda: "own", timeout=0.1)
+    assert time.monotonic() - started < 0.5
+    release.set()
+    thread.join()
+
+
+def test_a_deadline_failure_is_not_passed_on():
+    flights = SingleFlight(deadline_errors=(_CutShort,))
+    release = threading.Event()
+
+    def leader():
+        release.wait(1)
+        raise _CutShort()
+
+    thread, outcome = _start_leader(flights, "k", leader)
+    threading.Timer(0.05, release.set).start()
+    assert flights.do("k", lambda: "own", timeout=1) == ("own", False)
+    thread.join()
+    assert isinstance(outcome["error"], _CutShort)
+
+
+def test_a_result_cut_short_by_the_leaders_timeout_is_not_passed_on():
+    flights = SingleFlight()
+    # The leader's scrape swallows its timeout and returns nothing.
+    thread, outcome = _start_leader(flights, "k", lambda: time.sleep(0.2) or [], timeout=0.1)
+    assert flights.do("k", lambda: ["article"], timeout=1) == (["article"], False)
+    thread.join()
+    assert outcome["result"] == ([], False)
+
+
+class _SlowSession:
+    def __init__(self):
+        self.sent = []
+
+    def request(self, method, url, headers=None, **kwargs):
+        self.sent.append(headers.get("User-Agent"))
+        time.sleep(0.1)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b""
+        return response
+
+
+def test_gets_with_different_headers_are_not_coalesced(monkeypatch):
+    session = _SlowSession()
+    monkeypatch.setattr(http_client, "get_shared_session", lambda: session)
+    monkeypatch.setattr(http_client.http_cache, "ENABLED", False)
+    url = "http://flight-headers.test/"
+    threads = [
+        threading.Thread(target=http_client.get_session({"User-Agent": agent}).get, args=(url,))
+        for agent in ("A", "A", "B")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(session.sent) == ["A", "B"]
@@ -0,0 +1,48 @@
+import pytest
+
+import circuit_breaker
+import source_cache
+import source_runner
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    source_cache.clear()
+    circuit_breaker.reset()
+    yield
+    source_cache.clear()
+    circuit_breaker.reset()
+
+
+def _article(n):
+    return {"title": f"Runner test headline {n}", "url": f"https://runner.test/{n}", "source": "Runner"}
+
+
+def test_scrape_category_runs_the_picked_sources_in_order(capsys):
+    calls = []
+    source_map = {
+        "first": lambda: calls.append("first") or [_article(1)],
+        "second": lambda: calls.append("second") or [_article(2), _article(3)],
+        "unused": lambda: calls.append("unused") or [_article(4)],
+    }
+    articles = source_runner.scrape_category("runner_test", source_map, "India", ["second", "first", "unknown"])
+    assert [a["url"] for a in articles] == ["https://runner.test/2", "https://runner.test/3", "https://runner.test/1"]
+    assert sorted(calls) == ["first", "second"]
+    assert "runner_test (India - second): 2 articles" in capsys.readouterr().out
+
+
+def test_scrape_category_reports_errors_and_uses_the_source_cache():
+    calls = []
+
+    def broken():
+        raise RuntimeError("boom")
+
+    source_map = {"ok": lambda: calls.append("ok") or [_article(1)], "broken": broken}
+    errors = []
+    articles = source_runner.scrape_category("runner_test", source_map, "Global", errors=errors)
+    assert articles == [_article(1)]
+    assert errors == ["Error scraping broken: boom"]
+
+    # Served from the cache under (category, region, name) the second time.
+    assert source_runner.scrape_category("runner_test", source_map, "Global", ["ok"]) == [_article(1)]
+    assert calls == ["ok"]
@@ -0,0 +1,78 @@
+# title_normalizer.py
+import unicodedata
+from functools import lru_cache
+
+# Headlines repeat across pages, pagination and digests; remember the
+# cleaned form of recently seen ones.
+CACHE_SIZE = 8192
+
+MIN_LENGTH = 10
+MAX_LENGTH = 200
+
+# Typographic characters scrapers and the email renderer fold to ASCII.
+# A chain of str.replace beats str.translate here: each replace is a C scan
+# that returns the same string when the character is absent.
+_ASCII_REPLACEMENTS = (
+    ("“", '"'),  # left double quotation mark
+    ("”", '"'),  # right double quotation mark
+    ("‘", "'"),  # left single quotation mark
+    ("’", "'"),  # right single quotation mark
+    ("—", "-"),  # em dash
+    ("–", "-"),  # en dash
+    ("…", "..."),  # horizontal ellipsis
+    ("\xa0", " "),  # non-breaking space
+    ("′", "'"),  # prime
+    ("″", '"'),  # double prime
+)
+# Navigation items and ads that look like headlines (matched lower-case).
+_SKIP_WORDS = ("subscribe", "login", "register", "advertisement", "menu", "search", "newsletter")
+
+
+def _normalize(text):
+    """Collapses all whitespace (newlines, tabs, NBSP) to single spaces and trims."""
+    if not text:
+        return ""
+    return " ".join(text.split())
+
+
+def _clean_title(title):
+    """
+    Normalised headline, or None if it is too short or long to be one or
+    looks like navigation/ads.
+    """
+    title = _normalize(title)
+    if len(title) < MIN_LENGTH or len(title) > MAX_LENGTH:
+        return None
+    lowered = title.lower()
+    for word in _SKIP_WORDS:
+        if word in lowered:
+            return None
+    return title
+
+
+def _ascii_title(title):
+    """`clean_title` folded to plain ASCII, for the email renderer."""
+    if not title:
+        return None
+    if not title.isascii():
+        for char, replacement in _ASCII_REPLACEMENTS:
+            title = title.replace(char, replacement)
+        if not title.isascii():
+            title = unicodedata.normalize("NFKD", title).encode("ascii", "ignore").decode("ascii")
+    return _clean_title(title)
+
+
+# The public, memoised forms. Each cache holds finished results, so the
+# uncached functions (also reachable as `.__wrapped__`) call each other
+# directly rather than filling one another's caches.
+normalize = lru_cache(maxsize=CACHE_SIZE)(_normalize)
+clean_title = lru_cache(maxsize=CACHE_SIZE)(_clean_title)
+ascii_title = lru_cache(maxsize=CACHE_SIZE)(_ascii_title)
+
+
+def cache_info():
+    return {
+        "normalize": normalize.cache_info()._asdict(),
+        "clean_title": clean_title.cache_info()._asdict(),
+        "ascii_title": ascii_title.cache_info()._asdict(),
+    }